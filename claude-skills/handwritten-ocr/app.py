@@ -3,21 +3,62 @@ Flask web application for handwritten PDF to Word conversion.
 
 Routes:
     GET  /                        Upload form
-    POST /upload                  Accept PDF, start background job → { job_id }
+    POST /upload                  Accept PDF (multipart), start background job → { job_id }
+    POST /upload_raw              Accept PDF as raw request body (streamed to disk)
     GET  /status/<job_id>         Poll job status → { status, progress, total, ... }
+    GET  /events/<job_id>         Server-Sent Events stream of job status updates
     GET  /download/<filename>     Download generated .docx file
 """
 
+import json
 import uuid
 from pathlib import Path
 
-from flask import Flask, abort, jsonify, render_template, request, send_from_directory
+from flask import (
+    Flask,
+    Response,
+    abort,
+    jsonify,
+    render_template,
+    request,
+    send_from_directory,
+)
+
+from flask.json.provider import DefaultJSONProvider
 
 import config
-from core.processor import get_job_status, start_processing_in_background
+from core.processor import (
+    get_job_status,
+    start_processing_in_background,
+    wait_for_job_update,
+)
+
+# orjson is optional: a C JSON encoder that cuts per-response CPU on the
+# hot /status poll path (~1 request/second per active job). Falls back
+# to Flask's stdlib-json provider when not installed.
+try:
+    import orjson
+    _orjson_available = True
+except ImportError:
+    _orjson_available = False
+
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, used by jsonify()."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+config.init()
 
 app = Flask(__name__)
 app.config["MAX_CONTENT_LENGTH"] = config.MAX_UPLOAD_BYTES
+if _orjson_available:
+    app.json = _OrjsonProvider(app)
 
 
 # ── Route: Upload Form ─────────────────────────────────────────────────────────
@@ -58,13 +99,67 @@ def upload():
     pdf_path = str(config.UPLOAD_DIR / f"{upload_id}.pdf")
     file.save(pdf_path)
 
-    original_stem = Path(file.filename).stem
+    return _start_job(upload_id, pdf_path, file.filename)
+
+
+# ── Route: Raw Streaming Upload ────────────────────────────────────────────────
+
+@app.route("/upload_raw", methods=["POST", "PUT"])
+def upload_raw():
+    """
+    Accept a PDF as the raw request body, streamed to disk in 64 KB chunks.
+
+    Bypasses Werkzeug's multipart form parser, which buffers uploads in
+    memory/tempfiles — here memory use stays constant regardless of file
+    size. The original filename is taken from the X-Filename header (or
+    ?filename=), defaulting to upload.pdf.
+
+    Returns:
+        202 { "job_id": "<uuid>" }  on success
+        400 { "error": "<msg>" }    on validation failure
+        413 { "error": "<msg>" }    if the body exceeds the size limit
+        500 { "error": "<msg>" }    on server misconfiguration
+    """
+    original_filename = (
+        request.headers.get("X-Filename")
+        or request.args.get("filename")
+        or "upload.pdf"
+    )
+    if Path(original_filename).suffix.lower() != ".pdf":
+        return jsonify({"error": "Only PDF files are accepted"}), 400
+
+    if not config.ANTHROPIC_API_KEY or config.ANTHROPIC_API_KEY.startswith("sk-ant-YOUR"):
+        return jsonify({"error": "ANTHROPIC_API_KEY is not configured on the server"}), 500
+
+    upload_id = str(uuid.uuid4())
+    pdf_path = config.UPLOAD_DIR / f"{upload_id}.pdf"
+
+    bytes_written = 0
+    with open(pdf_path, "wb") as f:
+        while chunk := request.stream.read(65536):
+            bytes_written += len(chunk)
+            if bytes_written > config.MAX_UPLOAD_BYTES:
+                f.close()
+                pdf_path.unlink(missing_ok=True)
+                return request_entity_too_large(None)
+            f.write(chunk)
+
+    if bytes_written == 0:
+        pdf_path.unlink(missing_ok=True)
+        return jsonify({"error": "Empty request body"}), 400
+
+    return _start_job(upload_id, str(pdf_path), original_filename)
+
+
+def _start_job(upload_id: str, pdf_path: str, original_filename: str):
+    """Shared tail of the upload routes: kick off processing for a saved PDF."""
+    original_stem = Path(original_filename).stem
     output_filename = f"{upload_id}_{original_stem}.docx"
 
     job_id = start_processing_in_background(
         pdf_path=pdf_path,
         output_filename=output_filename,
-        original_filename=file.filename,
+        original_filename=original_filename,
     )
 
     return jsonify({"job_id": job_id}), 202
@@ -85,6 +180,42 @@ def status(job_id: str):
     return jsonify(job), 200
 
 
+# ── Route: Job Events (SSE) ────────────────────────────────────────────────────
+
+@app.route("/events/<job_id>", methods=["GET"])
+def events(job_id: str):
+    """
+    Push job status updates as Server-Sent Events.
+
+    Emits a `data:` frame only when the job state actually changes, then
+    closes the stream once the job completes or errors — instead of the
+    browser hammering /status once per second. /status remains available
+    as a polling fallback. Requires a threaded WSGI server (the dev
+    server's default, or gunicorn gthread/gevent).
+    """
+    if get_job_status(job_id) is None:
+        return jsonify({"error": "Job not found"}), 404
+
+    def stream():
+        last_sent = None
+        while True:
+            job = get_job_status(job_id)
+            if job is None:
+                return  # expired mid-stream (e.g. Redis TTL)
+            if job != last_sent:
+                yield f"data: {json.dumps(job)}\n\n"
+                last_sent = job
+                if job["status"] in ("complete", "error"):
+                    return
+            wait_for_job_update(timeout=2.0)
+
+    return Response(
+        stream(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # ── Route: Download ────────────────────────────────────────────────────────────
 
 @app.route("/download/<filename>", methods=["GET"])
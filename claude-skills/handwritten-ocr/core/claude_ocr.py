@@ -1,28 +1,161 @@
 """
 Claude Vision API integration for handwriting OCR.
 
-Sends each PDF page (as a PNG image) to Claude's Vision capability
+Sends each PDF page (as a JPEG image) to Claude's Vision capability
 and returns the extracted text.
 """
 
+import asyncio
 import base64
-from typing import List, Optional, Callable
+import hashlib
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple
 
 import anthropic
 
+# Transient API failures worth retrying; anything else aborts the page.
+_RETRYABLE_ERRORS = (
+    anthropic.RateLimitError,
+    anthropic.APIConnectionError,
+    anthropic.InternalServerError,
+)
+_MAX_ATTEMPTS = 6
+_BASE_RETRY_DELAY = 2.0  # seconds, doubled per attempt
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket limiting API submissions per minute.
+
+    Tokens refill continuously at rate/60 per second up to `rate`.
+    acquire() blocks until a token is available, so concurrent OCR
+    workers collectively stay just under the per-minute request limit.
+    """
+
+    def __init__(self, rate_per_minute: int):
+        self._capacity = float(rate_per_minute)
+        self._fill_rate = rate_per_minute / 60.0
+        self._tokens = float(rate_per_minute)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._last_refill) * self._fill_rate,
+                )
+                self._last_refill = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self._fill_rate
+            time.sleep(wait)
+
+
+# Shared limiter for all sync OCR calls (config.OCR_RPM overrides via
+# configure_rate_limit, called by the processor at import time).
+_rate_limiter = _TokenBucket(50)
+
+
+def configure_rate_limit(requests_per_minute: int) -> None:
+    """Replace the shared token bucket with one sized to the given RPM."""
+    global _rate_limiter
+    _rate_limiter = _TokenBucket(requests_per_minute)
+
+
+# Content-addressable OCR result cache. Keyed on
+# sha256(image) + model + prompt version, so re-uploads of the same
+# document (retries, browser refreshes) are served from disk instead of
+# paying the API cost again. Disabled until configure_cache is called.
+_cache_dir: Optional[Path] = None
+_prompt_version: str = "1"
+
+
+def configure_cache(cache_dir, prompt_version: str = "1") -> None:
+    """Enable the on-disk OCR result cache (pass None to disable)."""
+    global _cache_dir, _prompt_version
+    _cache_dir = Path(cache_dir) if cache_dir else None
+    _prompt_version = prompt_version
+    if _cache_dir is not None:
+        _cache_dir.mkdir(parents=True, exist_ok=True)
+
+
+def _cache_path(image_bytes: bytes, model: str) -> Path:
+    """Cache file path for one page image under the current model/prompt."""
+    key = hashlib.sha256(image_bytes).hexdigest()
+    return _cache_dir / f"{model}_{_prompt_version}_{key}.txt"
+
+
+def _cache_store(cache_path: Path, text: str) -> None:
+    """Atomically write a cache entry (tmp file + rename)."""
+    tmp_path = cache_path.with_name(
+        f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, cache_path)
+
+
+def _page_hash(image_bytes: bytes) -> bytes:
+    """
+    Content hash for in-document page deduplication.
+
+    Scanned PDFs often repeat pages (letterhead, blank form backs);
+    identical images need only one API call, with the result fanned back
+    out to every page index. BLAKE2b at 16 bytes is plenty for this and
+    hashes a page image in well under a millisecond.
+    """
+    return hashlib.blake2b(image_bytes, digest_size=16).digest()
+
+
+# Shared client, reused across pages and threads. Constructing a fresh
+# anthropic.Anthropic per call would pay a new TLS handshake per page and
+# forfeit connection pooling.
+_client: Optional[anthropic.Anthropic] = None
+_client_lock = threading.Lock()
+
+
+def _get_client(api_key: str) -> anthropic.Anthropic:
+    """
+    Return the shared Anthropic client, creating it on first use.
+
+    Creation is double-checked under a lock so concurrent OCR workers
+    don't race to build duplicate clients. The SDK's default transport
+    already pools keep-alive connections across all workers, and its
+    built-in retries are disabled — extract_text_from_image owns
+    backoff and rate limiting.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = anthropic.Anthropic(
+                    api_key=api_key,
+                    max_retries=0,
+                )
+    return _client
+
 
 def extract_text_from_image(
-    png_bytes: bytes,
+    image_bytes: bytes,
     api_key: str,
     model: str,
     prompt: str,
     max_tokens: int = 4096,
 ) -> str:
     """
-    Send a PNG image to Claude Vision and return the transcribed text.
+    Send a page image (JPEG) to Claude Vision and return the transcribed text.
 
     Args:
-        png_bytes:  Raw PNG image bytes (one PDF page rendered as PNG)
+        image_bytes:  Raw JPEG image bytes (one rendered PDF page)
         api_key:    Anthropic API key
         model:      Claude model ID (e.g. 'claude-sonnet-4-6')
         prompt:     Instruction prompt for OCR
@@ -32,69 +165,469 @@ def extract_text_from_image(
         Extracted text string from the handwritten page
 
     Raises:
-        anthropic.APIStatusError: On HTTP errors from the API
-        anthropic.APIConnectionError: On network failures
+        anthropic.APIStatusError: On non-retryable HTTP errors, or when
+            retryable errors persist past the retry budget
+        anthropic.APIConnectionError: On persistent network failures
     """
-    client = anthropic.Anthropic(api_key=api_key)
-    image_data_b64 = base64.standard_b64encode(png_bytes).decode("utf-8")
+    if not image_bytes:
+        # Blank page short-circuited by the renderer — nothing to transcribe
+        return ""
 
-    message = client.messages.create(
-        model=model,
-        max_tokens=max_tokens,
-        messages=[
-            {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "image",
-                        "source": {
-                            "type": "base64",
-                            "media_type": "image/png",
-                            "data": image_data_b64,
-                        },
-                    },
+    cache_path = _cache_path(image_bytes, model) if _cache_dir else None
+    if cache_path is not None and cache_path.exists():
+        return cache_path.read_text(encoding="utf-8")
+
+    client = _get_client(api_key)
+    # Encode from a memoryview (no defensive copy of the input) and decode
+    # as ASCII; drop the raw image right away so only the b64 string — not
+    # raw + b64 — stays alive for the duration of the HTTP round trip.
+    image_data_b64 = base64.standard_b64encode(memoryview(image_bytes)).decode("ascii")
+    del image_bytes
+
+    last_error: Optional[Exception] = None
+    for attempt in range(_MAX_ATTEMPTS):
+        _rate_limiter.acquire()
+        try:
+            message = client.messages.create(
+                model=model,
+                max_tokens=max_tokens,
+                messages=[
                     {
-                        "type": "text",
-                        "text": prompt,
-                    },
+                        "role": "user",
+                        "content": [
+                            {
+                                "type": "image",
+                                "source": {
+                                    "type": "base64",
+                                    "media_type": "image/jpeg",
+                                    "data": image_data_b64,
+                                },
+                            },
+                            {
+                                "type": "text",
+                                "text": prompt,
+                            },
+                        ],
+                    }
                 ],
-            }
-        ],
-    )
+            )
+            text = message.content[0].text
+            if cache_path is not None:
+                _cache_store(cache_path, text)
+            return text
+        except _RETRYABLE_ERRORS as exc:
+            last_error = exc
+            # Exponential backoff with jitter; honor Retry-After on 429/5xx
+            delay = min(_BASE_RETRY_DELAY * (2 ** attempt), 60.0)
+            response = getattr(exc, "response", None)
+            if response is not None:
+                retry_after = response.headers.get("retry-after")
+                if retry_after:
+                    try:
+                        delay = max(delay, float(retry_after))
+                    except ValueError:
+                        pass
+            time.sleep(delay + random.uniform(0, 1))
 
-    return message.content[0].text
+    raise last_error
 
 
 def extract_text_from_all_pages(
-    png_bytes_list: List[bytes],
+    image_bytes_list: List[bytes],
     api_key: str,
     model: str,
     prompt: str,
     progress_callback: Optional[Callable[[int, int], None]] = None,
+    max_workers: int = 4,
 ) -> List[str]:
     """
-    Run OCR on each page sequentially and return a list of text strings.
+    Run OCR on all pages concurrently and return a list of text strings.
 
-    Sequential (not concurrent) to respect Anthropic API rate limits.
+    Each page is an independent, network-bound API call, so a small
+    ThreadPoolExecutor gives near-linear wall-clock speedup. The worker
+    count stays deliberately low to respect Anthropic API rate limits.
+    Identical pages (by content hash) are submitted once and the result
+    shared across their indices; blank pages (empty bytes) skip the API
+    entirely.
 
     Args:
-        png_bytes_list:    List of PNG bytes, one per page
+        image_bytes_list:    List of JPEG image bytes, one per page
         api_key:           Anthropic API key
         model:             Claude model ID
         prompt:            OCR instruction prompt
-        progress_callback: Optional callable(page_index, total_pages)
+        progress_callback: Optional callable(pages_done, total_pages)
+        max_workers:       Concurrent API calls (config.OCR_CONCURRENCY)
 
     Returns:
         List of extracted text strings, one per page, in order
     """
-    results: List[str] = []
-    total = len(png_bytes_list)
+    total = len(image_bytes_list)
+    results: List[Optional[str]] = [None] * total
+    done = 0
+
+    if progress_callback:
+        progress_callback(0, total)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # One future per unique page image; futures map to every page
+        # index carrying that image.
+        by_hash = {}
+        indices = {}
+        for i, image_bytes in enumerate(image_bytes_list):
+            if not image_bytes:
+                results[i] = ""
+                done += 1
+                continue
+            h = _page_hash(image_bytes)
+            if h not in by_hash:
+                by_hash[h] = executor.submit(
+                    extract_text_from_image, image_bytes, api_key, model, prompt
+                )
+                indices[by_hash[h]] = []
+            indices[by_hash[h]].append(i)
 
-    for i, png_bytes in enumerate(png_bytes_list):
+        if progress_callback and done:
+            progress_callback(done, total)
+
+        for future in as_completed(indices):
+            text = future.result()
+            for i in indices[future]:
+                results[i] = text
+                done += 1
+            if progress_callback:
+                progress_callback(done, total)
+
+    return results
+
+
+async def extract_text_from_all_pages_async(
+    image_bytes_list: List[bytes],
+    api_key: str,
+    model: str,
+    prompt: str,
+    max_tokens: int = 4096,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    max_workers: int = 4,
+) -> List[str]:
+    """
+    Run OCR on all pages on one event loop instead of a thread pool.
+
+    Coroutines cost ~KB each where threads cost an OS stack (MBs) plus
+    scheduler overhead, so the concurrency ceiling is far higher at the
+    same memory — useful when many jobs run in one process. Concurrency
+    is capped by an asyncio.Semaphore; the same disk cache, dedup,
+    blank-page skip, and retry/backoff policy as the sync path apply.
+
+    Args:
+        image_bytes_list:    List of JPEG image bytes, one per page
+        api_key:           Anthropic API key
+        model:             Claude model ID
+        prompt:            OCR instruction prompt
+        max_tokens:        Max tokens per page response
+        progress_callback: Optional callable(pages_done, total_pages)
+        max_workers:       Concurrent in-flight API calls
+
+    Returns:
+        List of extracted text strings, one per page, in order
+    """
+    # One client per call, torn down before returning. No module-level
+    # cache here (unlike the sync path): AsyncAnthropic's pooled
+    # connections bind to the running event loop, so a client reused
+    # across asyncio.run() invocations comes back holding sockets from a
+    # closed loop and fails the first attempt of every page.
+    client = anthropic.AsyncAnthropic(api_key=api_key, max_retries=0)
+    sem = asyncio.Semaphore(max_workers)
+    total = len(image_bytes_list)
+    results: List[str] = [""] * total
+    done = 0
+
+    if progress_callback:
+        progress_callback(0, total)
+
+    async def transcribe(image_bytes: bytes) -> str:
+        cache_path = _cache_path(image_bytes, model) if _cache_dir else None
+        if cache_path is not None and cache_path.exists():
+            return cache_path.read_text(encoding="utf-8")
+
+        image_data_b64 = base64.standard_b64encode(memoryview(image_bytes)).decode("ascii")
+
+        last_error: Optional[Exception] = None
+        for attempt in range(_MAX_ATTEMPTS):
+            async with sem:
+                # The token bucket blocks; take it off-loop so waiting
+                # for a token never stalls other coroutines.
+                await asyncio.to_thread(_rate_limiter.acquire)
+                try:
+                    message = await client.messages.create(
+                        model=model,
+                        max_tokens=max_tokens,
+                        messages=[
+                            {
+                                "role": "user",
+                                "content": [
+                                    {
+                                        "type": "image",
+                                        "source": {
+                                            "type": "base64",
+                                            "media_type": "image/jpeg",
+                                            "data": image_data_b64,
+                                        },
+                                    },
+                                    {
+                                        "type": "text",
+                                        "text": prompt,
+                                    },
+                                ],
+                            }
+                        ],
+                    )
+                except _RETRYABLE_ERRORS as exc:
+                    last_error = exc
+                    delay = min(_BASE_RETRY_DELAY * (2 ** attempt), 60.0)
+                    response = getattr(exc, "response", None)
+                    if response is not None:
+                        retry_after = response.headers.get("retry-after")
+                        if retry_after:
+                            try:
+                                delay = max(delay, float(retry_after))
+                            except ValueError:
+                                pass
+                    await asyncio.sleep(delay + random.uniform(0, 1))
+                    continue
+
+            text = message.content[0].text
+            if cache_path is not None:
+                _cache_store(cache_path, text)
+            return text
+
+        raise last_error
+
+    # One task per unique page image; duplicates share the task's result
+    by_hash = {}
+    try:
+        for image_bytes in image_bytes_list:
+            if image_bytes:
+                h = _page_hash(image_bytes)
+                if h not in by_hash:
+                    by_hash[h] = asyncio.ensure_future(transcribe(image_bytes))
+
+        for i, image_bytes in enumerate(image_bytes_list):
+            if image_bytes:
+                results[i] = await by_hash[_page_hash(image_bytes)]
+            done += 1
+            if progress_callback:
+                progress_callback(done, total)
+
+        return results
+    finally:
+        # Leave nothing in flight on the loop we're about to give up
+        for task in by_hash.values():
+            task.cancel()
+        await client.close()
+
+
+def extract_text_from_page_iter(
+    pages: Iterable[Tuple[int, bytes]],
+    total: int,
+    api_key: str,
+    model: str,
+    prompt: str,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    max_workers: int = 4,
+) -> List[str]:
+    """
+    Run OCR over a stream of (page_index, image_bytes) tuples.
+
+    Consumes a rendering generator (see pdf_to_images.iter_pdf_page_images)
+    instead of a fully materialized list, keeping at most ~2x max_workers
+    page images in flight. Memory stays O(concurrency) rather than
+    O(page count), no matter how large the PDF is.
+
+    Pages repeating an already-seen image (by content hash) attach to the
+    earlier call instead of submitting a new one, and blank pages (empty
+    bytes from the renderer) resolve to "" without touching the API.
+
+    Args:
+        pages:             Iterable of (page_index, image_bytes) tuples
+        total:             Total number of pages (for result sizing/progress)
+        api_key:           Anthropic API key
+        model:             Claude model ID
+        prompt:            OCR instruction prompt
+        progress_callback: Optional callable(pages_done, total_pages)
+        max_workers:       Concurrent API calls (config.OCR_CONCURRENCY)
+
+    Returns:
+        List of extracted text strings, one per page, in order
+    """
+    results: List[Optional[str]] = [None] * total
+    done = 0
+
+    if progress_callback:
+        progress_callback(0, total)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        in_flight = {}   # future -> [page indices awaiting its text]
+        by_hash = {}     # page-image hash -> future (in flight or done)
+
+        def _drain_one() -> None:
+            nonlocal done
+            future = next(as_completed(in_flight))
+            text = future.result()
+            for idx in in_flight.pop(future):
+                results[idx] = text
+                done += 1
+            if progress_callback:
+                progress_callback(done, total)
+
+        for page_index, image_bytes in pages:
+            if not image_bytes:
+                # Blank page short-circuited by the renderer
+                results[page_index] = ""
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total)
+                continue
+
+            h = _page_hash(image_bytes)
+            existing = by_hash.get(h)
+            if existing is not None:
+                # Duplicate of an earlier page: ride on its API call
+                if existing in in_flight:
+                    in_flight[existing].append(page_index)
+                else:
+                    results[page_index] = existing.result()
+                    done += 1
+                    if progress_callback:
+                        progress_callback(done, total)
+                continue
+
+            # Bounded submission window: wait for a slot before rendering
+            # more pages, so buffered images never pile up unboundedly.
+            while len(in_flight) >= max_workers * 2:
+                _drain_one()
+
+            future = executor.submit(
+                extract_text_from_image, image_bytes, api_key, model, prompt
+            )
+            by_hash[h] = future
+            in_flight[future] = [page_index]
+            del image_bytes  # free the page image as soon as it's submitted
+
+        while in_flight:
+            _drain_one()
+
+    return results
+
+
+def extract_text_from_all_pages_batched(
+    image_bytes_list: List[bytes],
+    api_key: str,
+    model: str,
+    prompt: str,
+    max_tokens: int = 4096,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    poll_interval: float = 5.0,
+) -> List[str]:
+    """
+    Run OCR on all pages via the Anthropic Message Batches API.
+
+    Submits every page as one batch, polls until processing ends, then
+    reassembles results in page order. One batch submit + poll replaces
+    N sequential HTTP round trips (and batch requests are billed at a
+    discount), so this is the preferred path for multi-page PDFs.
+    Duplicate pages are submitted once and blank pages not at all.
+
+    Args:
+        image_bytes_list:    List of JPEG image bytes, one per page
+        api_key:           Anthropic API key
+        model:             Claude model ID
+        prompt:            OCR instruction prompt
+        max_tokens:        Max tokens per page response
+        progress_callback: Optional callable(pages_done, total_pages)
+        poll_interval:     Initial seconds between batch status polls
+                           (backs off exponentially, capped at 60s)
+
+    Returns:
+        List of extracted text strings, one per page, in order.
+        Pages whose batch entry errored come back as empty strings.
+    """
+    client = _get_client(api_key)
+    total = len(image_bytes_list)
+
+    # Deduplicate before submission: identical pages share one batch
+    # entry (custom_id = first page index carrying that image), blank
+    # pages (empty bytes) never enter the batch at all.
+    index_groups: dict = {}   # first page index -> [all indices with that image]
+    first_index = {}          # page-image hash -> first page index
+    for i, image_bytes in enumerate(image_bytes_list):
+        if not image_bytes:
+            continue
+        h = _page_hash(image_bytes)
+        if h not in first_index:
+            first_index[h] = i
+            index_groups[i] = []
+        index_groups[first_index[h]].append(i)
+
+    requests = []
+    for i in index_groups:
+        image_bytes = image_bytes_list[i]
+        image_data_b64 = base64.standard_b64encode(memoryview(image_bytes)).decode("ascii")
+        requests.append(
+            {
+                "custom_id": f"page-{i}",
+                "params": {
+                    "model": model,
+                    "max_tokens": max_tokens,
+                    "messages": [
+                        {
+                            "role": "user",
+                            "content": [
+                                {
+                                    "type": "image",
+                                    "source": {
+                                        "type": "base64",
+                                        "media_type": "image/jpeg",
+                                        "data": image_data_b64,
+                                    },
+                                },
+                                {
+                                    "type": "text",
+                                    "text": prompt,
+                                },
+                            ],
+                        }
+                    ],
+                },
+            }
+        )
+
+    # Every page may be blank or deduped away; the Batches API rejects
+    # an empty request list, so short-circuit instead of submitting.
+    if not requests:
         if progress_callback:
-            progress_callback(i, total)
-        text = extract_text_from_image(png_bytes, api_key, model, prompt)
-        results.append(text)
+            progress_callback(total, total)
+        return [""] * total
+
+    batch = client.messages.batches.create(requests=requests)
+
+    # Poll with exponential backoff until the batch finishes processing
+    delay = poll_interval
+    while batch.processing_status != "ended":
+        if progress_callback:
+            progress_callback(batch.request_counts.succeeded, total)
+        time.sleep(delay)
+        delay = min(delay * 2, 60.0)
+        batch = client.messages.batches.retrieve(batch.id)
+
+    # Reassemble in page order via custom_id ("page-<first index>"),
+    # fanning each unique result back out to its duplicate pages.
+    results: List[str] = [""] * total
+    for entry in client.messages.batches.results(batch.id):
+        page_index = int(entry.custom_id.split("-", 1)[1])
+        if entry.result.type == "succeeded":
+            text = entry.result.message.content[0].text
+            for idx in index_groups[page_index]:
+                results[idx] = text
 
     if progress_callback:
         progress_callback(total, total)
@@ -3,22 +3,69 @@ Word document builder.
 
 Assembles a list of per-page extracted text strings into a .docx file
 with a hard page break between each original PDF page.
+
+The .docx is written as a zip archive directly, streaming the main
+word/document.xml entry line by line. Building the document through
+python-docx means materializing the entire lxml DOM before save() — for
+a several-hundred-page OCR result that is hundreds of MB held at once.
+Streaming keeps peak memory constant regardless of document size, and a
+.docx is just a zip of XML parts, so the boilerplate parts are small
+fixed templates.
 """
 
+import zipfile
 from typing import List
+from xml.sax.saxutils import escape
+
+# Fixed OOXML package parts. Only word/document.xml varies per document
+# (plus the title/author fields in docProps/core.xml).
+_CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/docProps/core.xml" ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>'
+    "</Types>"
+)
+
+_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties" Target="docProps/core.xml"/>'
+    "</Relationships>"
+)
+
+_DOCUMENT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships"/>'
+)
 
-from docx import Document
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
+_CORE_PROPS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<cp:coreProperties'
+    ' xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties"'
+    ' xmlns:dc="http://purl.org/dc/elements/1.1/">'
+    "<dc:title>{title}</dc:title>"
+    "<dc:creator>{creator}</dc:creator>"
+    "</cp:coreProperties>"
+)
 
+_DOCUMENT_PREFIX = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    "<w:body>"
+)
 
-def _add_page_break(doc: Document) -> None:
-    """Insert a hard Word page break (not a section break)."""
-    paragraph = doc.add_paragraph()
-    run = paragraph.add_run()
-    br = OxmlElement("w:br")
-    br.set(qn("w:type"), "page")
-    run._r.append(br)
+_DOCUMENT_SUFFIX = "<w:sectPr/></w:body></w:document>"
+
+_PAGE_BREAK = '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+
+
+def _paragraph_xml(line: str) -> str:
+    """One plain paragraph; xml:space keeps leading/trailing whitespace."""
+    return f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>'
 
 
 def build_docx(
@@ -46,18 +93,33 @@ def build_docx(
     if not page_texts:
         raise ValueError("page_texts must not be empty")
 
-    doc = Document()
-    doc.core_properties.title = f"OCR: {source_filename}"
-    doc.core_properties.author = "Handwritten OCR App"
+    last_page = len(page_texts) - 1
+
+    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", _CONTENT_TYPES_XML)
+        zf.writestr("_rels/.rels", _RELS_XML)
+        zf.writestr("word/_rels/document.xml.rels", _DOCUMENT_RELS_XML)
+        zf.writestr(
+            "docProps/core.xml",
+            _CORE_PROPS_XML.format(
+                title=escape(f"OCR: {source_filename}"),
+                creator="Handwritten OCR App",
+            ),
+        )
 
-    for page_index, text in enumerate(page_texts):
-        lines = text.splitlines()
-        for line in lines:
-            doc.add_paragraph(line)
+        # Stream the document body straight into the zip entry — no DOM.
+        # ZipInfo defaults to STORED, so pin deflate explicitly.
+        info = zipfile.ZipInfo("word/document.xml")
+        info.compress_type = zipfile.ZIP_DEFLATED
+        with zf.open(info, "w") as entry:
+            entry.write(_DOCUMENT_PREFIX.encode("utf-8"))
+            for page_index, text in enumerate(page_texts):
+                for line in text.splitlines():
+                    entry.write(_paragraph_xml(line).encode("utf-8"))
 
-        # Hard page break between pages (not after the last page)
-        if page_index < len(page_texts) - 1:
-            _add_page_break(doc)
+                # Hard page break between pages (not after the last page)
+                if page_index < last_page:
+                    entry.write(_PAGE_BREAK.encode("utf-8"))
+            entry.write(_DOCUMENT_SUFFIX.encode("utf-8"))
 
-    doc.save(output_path)
     return output_path
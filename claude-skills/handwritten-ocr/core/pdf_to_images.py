@@ -1,19 +1,40 @@
 """
-PDF to PNG image pipeline.
+PDF to page-image pipeline.
 
-Renders each page of a PDF to PNG bytes using PyMuPDF (fitz).
+Renders each page of a PDF to JPEG bytes using PyMuPDF (fitz).
 No poppler/pdftoppm dependency needed — PyMuPDF bundles its own renderer.
 
+JPEG (quality 85) instead of PNG: handwriting scans tolerate lossy
+encoding with no OCR accuracy loss, and the upload payload shrinks
+4-10x before the +33% base64 expansion for the API call. Pages are
+rendered grayscale — ink is essentially binary, so dropping the two
+extra color channels cuts another ~3x off the pixel buffer and JPEG
+size without hurting transcription.
+
 For pre-flight PDF validation and auto-repair, reuses the existing
 PDFSkill from the parent repository.
 """
 
+import atexit
+import io
+import multiprocessing
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional, Tuple
 
 import fitz  # PyMuPDF
 
+# Pillow is optional but preferred for JPEG encoding: it wraps
+# libjpeg-turbo's SIMD paths, which are much faster than routing the
+# pixel buffer through PyMuPDF's own encoder.
+try:
+    from PIL import Image
+    _pil_available = True
+except ImportError:
+    _pil_available = False
+
 # Allow importing the existing PDFSkill from the parent repo
 # File now lives at: claude-skills/handwritten-ocr/core/pdf_to_images.py
 # PDFSkill lives at: skills/pdf_skill/pdf_skill.py (4 levels up from here)
@@ -38,16 +59,181 @@ def _validate_and_repair(pdf_path: str) -> None:
         raise RuntimeError(f"PDF validation failed: {result.get('message')}")
 
 
-def pdf_to_png_bytes_list(pdf_path: str, dpi: int = 150) -> List[bytes]:
+def pdf_page_count(pdf_path: str) -> int:
+    """Return the number of pages in a PDF without rendering anything."""
+    doc = fitz.open(pdf_path)
+    try:
+        return doc.page_count
+    finally:
+        doc.close()
+
+
+def _page_matrix(page: "fitz.Page", dpi: int, max_edge_px: int) -> "fitz.Matrix":
+    """
+    Compute the render matrix for a page, capping the longest output edge.
+
+    Oversized pages (posters, architectural scans) are downscaled so their
+    longest rendered side stays at max_edge_px — more resolution than that
+    doesn't help handwriting OCR and just inflates the upload.
+    """
+    zoom = dpi / 72.0
+    longest_side = max(page.rect.width, page.rect.height)
+    if longest_side > 0:
+        zoom = min(zoom, max_edge_px / longest_side)
+    return fitz.Matrix(zoom, zoom)
+
+
+# A sampled pixel darker than this (out of 255) counts as ink; a page is
+# blank only when fewer than this fraction of samples are ink. Fraction,
+# not mean brightness: a few lines of text barely move the whole-page
+# mean, so a mean threshold misclassifies sparse pages — the normal case
+# for handwritten scans — as blank.
+_BLANK_INK_MAX = 128
+_BLANK_INK_FRACTION = 0.001
+
+
+def _is_blank(pixmap: "fitz.Pixmap") -> bool:
+    """
+    Detect a truly blank page from the raw pixel buffer.
+
+    Samples the buffer at a stride so the check stays a few tens of
+    microseconds regardless of page size — no numpy dependency needed.
+    Only pages with essentially no dark pixels (separator sheets, the
+    back of single-sided pages) are skipped; any visible ink keeps the
+    page in the OCR pipeline.
+    """
+    samples = pixmap.samples
+    if not samples:
+        return False
+    stride = max(1, len(samples) // 65536)
+    sub = samples[::stride]
+    dark = sum(1 for v in sub if v < _BLANK_INK_MAX)
+    return dark < _BLANK_INK_FRACTION * len(sub)
+
+
+# Margin cropping: pixels at least this bright count as background, and
+# the ink bounding box is padded by this many pixels before cropping.
+_CROP_BACKGROUND_MIN = 240
+_CROP_PAD_PX = 24
+
+
+def _crop_margins(img: "Image.Image") -> "Image.Image":
+    """
+    Crop large white borders around the ink before JPEG encoding.
+
+    Ink-on-paper scans often carry wide empty margins that inflate the
+    upload for no OCR benefit. Thresholding to a binary mask and taking
+    getbbox() runs in C, so finding the ink bounding box is cheap; the
+    box is padded so descenders and edge strokes aren't clipped, and the
+    crop is skipped when it wouldn't meaningfully shrink the image.
+    """
+    gray = img if img.mode == "L" else img.convert("L")
+    mask = gray.point(lambda v: 0 if v >= _CROP_BACKGROUND_MIN else 255)
+    bbox = mask.getbbox()
+    if bbox is None:
+        return img
+    left = max(0, bbox[0] - _CROP_PAD_PX)
+    top = max(0, bbox[1] - _CROP_PAD_PX)
+    right = min(img.width, bbox[2] + _CROP_PAD_PX)
+    bottom = min(img.height, bbox[3] + _CROP_PAD_PX)
+    if (right - left) * (bottom - top) > 0.9 * img.width * img.height:
+        return img
+    return img.crop((left, top, right, bottom))
+
+
+def _encode_jpeg(pixmap: "fitz.Pixmap", quality: int) -> bytes:
+    """
+    Encode a rendered pixmap to JPEG bytes.
+
+    When Pillow is available, the raw pixmap.samples buffer is handed
+    straight to libjpeg-turbo via Image.frombuffer — no intermediate
+    PNG/JPEG round-trip through PyMuPDF's encoder — and wide white
+    margins are cropped first. Falls back to pixmap.tobytes otherwise.
     """
-    Render all pages of a PDF to a list of PNG byte strings.
+    if _pil_available and not pixmap.alpha and pixmap.n in (1, 3):
+        mode = "L" if pixmap.n == 1 else "RGB"
+        img = Image.frombuffer(
+            mode,
+            (pixmap.width, pixmap.height),
+            pixmap.samples,
+            "raw",
+            mode,
+            0,
+            1,
+        )
+        img = _crop_margins(img)
+        buf = io.BytesIO()
+        img.save(buf, "JPEG", quality=quality, optimize=False)
+        return buf.getvalue()
+    return pixmap.tobytes("jpg", jpg_quality=quality)
+
+
+# Per-worker-process document handle, set by _init_render_worker.
+# fitz objects don't pickle, so each pool worker opens the PDF once in
+# its initializer and renders every page assigned to it from that handle
+# — instead of paying header/xref parsing again for every single page.
+_worker_doc: Optional["fitz.Document"] = None
+
+
+def _init_render_worker(pdf_path: str) -> None:
+    """Pool initializer: open the PDF once for this worker's lifetime."""
+    global _worker_doc
+    _worker_doc = fitz.open(pdf_path)
+    atexit.register(_worker_doc.close)
+
+
+def _render_one(
+    page_index: int,
+    dpi: int,
+    jpg_quality: int,
+    max_edge_px: int,
+) -> bytes:
+    """Render a single page to JPEG bytes inside a pool worker."""
+    page = _worker_doc[page_index]
+    matrix = _page_matrix(page, dpi, max_edge_px)
+    pixmap = page.get_pixmap(matrix=matrix, colorspace=fitz.csGRAY)
+    if _is_blank(pixmap):
+        return b""
+    return _encode_jpeg(pixmap, jpg_quality)
+
+
+def _mp_context() -> Optional[multiprocessing.context.BaseContext]:
+    """Prefer fork on platforms that support it so PyMuPDF globals aren't re-initialized per worker."""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def iter_pdf_page_images(
+    pdf_path: str,
+    dpi: int = 150,
+    jpg_quality: int = 85,
+    max_edge_px: int = 2000,
+    render_workers: int = 1,
+) -> Iterator[Tuple[int, bytes]]:
+    """
+    Render PDF pages one at a time, yielding (page_index, jpeg_bytes).
+
+    Streaming generator: each page's image bytes can be freed as soon as
+    the consumer is done with them, so peak memory stays at one page
+    instead of the whole document (a 100-page deck at 150 DPI would
+    otherwise hold hundreds of MB at once).
+
+    Rasterization is CPU-bound, so with render_workers > 1 pages are
+    rendered in a ProcessPoolExecutor and still yielded in page order —
+    wall-clock drops roughly linearly with core count on multi-page PDFs.
 
     Args:
-        pdf_path: Absolute path to the PDF file
-        dpi:      Rendering resolution (default 150 DPI)
+        pdf_path:       Absolute path to the PDF file
+        dpi:            Rendering resolution (default 150 DPI)
+        jpg_quality:    JPEG encode quality (default 85)
+        max_edge_px:    Cap on the longest rendered side in pixels
+        render_workers: Worker processes for rendering (1 = in-process)
 
-    Returns:
-        List of PNG bytes, one per page, in page order
+    Yields:
+        (page_index, jpeg_bytes) tuples in page order. Near-blank pages
+        yield empty bytes (b"") so downstream OCR can skip them without
+        an API call.
 
     Raises:
         RuntimeError: If PDF validation/repair fails
@@ -55,14 +241,69 @@ def pdf_to_png_bytes_list(pdf_path: str, dpi: int = 150) -> List[bytes]:
     """
     _validate_and_repair(pdf_path)
 
+    if render_workers > 1:
+        page_count = pdf_page_count(pdf_path)
+        render = partial(
+            _render_one,
+            dpi=dpi,
+            jpg_quality=jpg_quality,
+            max_edge_px=max_edge_px,
+        )
+        with ProcessPoolExecutor(
+            max_workers=render_workers,
+            mp_context=_mp_context(),
+            initializer=_init_render_worker,
+            initargs=(pdf_path,),
+        ) as executor:
+            yield from enumerate(
+                executor.map(render, range(page_count), chunksize=4)
+            )
+        return
+
     doc = fitz.open(pdf_path)
-    pages_png: List[bytes] = []
-    zoom = dpi / 72.0
-    matrix = fitz.Matrix(zoom, zoom)
+    try:
+        for i, page in enumerate(doc):
+            matrix = _page_matrix(page, dpi, max_edge_px)
+            pixmap = page.get_pixmap(matrix=matrix, colorspace=fitz.csGRAY)
+            yield i, (b"" if _is_blank(pixmap) else _encode_jpeg(pixmap, jpg_quality))
+            pixmap = None  # drop pixel buffer before rendering the next page
+    finally:
+        doc.close()
+
+
+def pdf_to_image_bytes_list(
+    pdf_path: str,
+    dpi: int = 150,
+    jpg_quality: int = 85,
+    max_edge_px: int = 2000,
+    render_workers: int = 1,
+) -> List[bytes]:
+    """
+    Render all pages of a PDF to a list of JPEG byte strings.
+
+    Convenience wrapper around iter_pdf_page_images for callers that need
+    every page in memory at once (e.g. the Message Batches path).
 
-    for page in doc:
-        pixmap = page.get_pixmap(matrix=matrix, colorspace=fitz.csRGB)
-        pages_png.append(pixmap.tobytes("png"))
+    Args:
+        pdf_path:    Absolute path to the PDF file
+        dpi:         Rendering resolution (default 150 DPI)
+        jpg_quality: JPEG encode quality (default 85)
+        max_edge_px: Cap on the longest rendered side in pixels
+
+    Returns:
+        List of JPEG bytes, one per page, in page order
 
-    doc.close()
-    return pages_png
+    Raises:
+        RuntimeError: If PDF validation/repair fails
+        fitz.FileDataError: If PyMuPDF cannot parse the PDF
+    """
+    return [
+        image_bytes
+        for _, image_bytes in iter_pdf_page_images(
+            pdf_path,
+            dpi=dpi,
+            jpg_quality=jpg_quality,
+            max_edge_px=max_edge_px,
+            render_workers=render_workers,
+        )
+    ]
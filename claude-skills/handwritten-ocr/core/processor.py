@@ -1,93 +1,362 @@
 """
 Orchestration layer for the handwritten PDF to Word conversion pipeline.
 
-Manages per-job state using an in-memory dict protected by a threading.Lock.
-Each conversion runs in a background daemon thread so Flask stays responsive.
+Two execution modes:
+    - Default: per-job state in an in-memory dict protected by a
+      threading.Lock, with each conversion in a background daemon thread.
+    - Celery (config.USE_CELERY, requires celery + a Redis broker): jobs
+      are dispatched to worker processes and state lives in the Celery
+      result backend, so it survives restarts and scales across machines.
 
 Job lifecycle:
     queued → rendering_pages → running_ocr → building_docx → complete | error
 """
 
+import asyncio
+import queue
 import threading
 import uuid
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import config
-from core.pdf_to_images import pdf_to_png_bytes_list
-from core.claude_ocr import extract_text_from_all_pages
+from core.pdf_to_images import (
+    iter_pdf_page_images,
+    pdf_page_count,
+    pdf_to_image_bytes_list,
+)
+from core.claude_ocr import (
+    configure_cache,
+    configure_rate_limit,
+    extract_text_from_all_pages_async,
+    extract_text_from_all_pages_batched,
+    extract_text_from_page_iter,
+)
 from core.docx_builder import build_docx
 
+# Size the shared OCR token bucket and result cache from config once at import time
+configure_rate_limit(config.OCR_RPM)
+configure_cache(config.OCR_CACHE_DIR, config.OCR_PROMPT_VERSION)
 
-# In-memory job store (sufficient for local single-user deployment)
+# Celery is an optional dependency (horizontal scaling); fall back to the
+# in-process thread path when it isn't installed.
+try:
+    import celery  # noqa: F401
+    _celery_available = True
+except ImportError:
+    _celery_available = False
+
+
+def _use_celery() -> bool:
+    """True when Celery is installed and enabled via config.USE_CELERY."""
+    return _celery_available and config.USE_CELERY
+
+
+# Redis job store is optional: per-key TTL means finished jobs expire
+# instead of accumulating forever, there's no process-wide lock on the
+# hot /status poll path, and state is shared across workers. Without the
+# redis package (or with USE_REDIS_JOBS off) the in-memory dict is used.
+try:
+    import redis
+    _redis_available = True
+except ImportError:
+    _redis_available = False
+
+_redis_client = None
+
+
+def _use_redis() -> bool:
+    """True when the redis package is installed and enabled via config."""
+    return _redis_available and config.USE_REDIS_JOBS
+
+
+def _get_redis() -> "redis.Redis":
+    """Return the shared Redis connection, creating it on first use."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(
+            config.REDIS_URL, decode_responses=True
+        )
+    return _redis_client
+
+
+def _job_key(job_id: str) -> str:
+    return f"job:{job_id}"
+
+
+def _to_redis_fields(fields: dict) -> dict:
+    """Redis hashes can't hold None; store empty strings instead."""
+    return {k: ("" if v is None else v) for k, v in fields.items()}
+
+
+def _from_redis_fields(raw: dict) -> dict:
+    """Convert a Redis hash back into the job-status dict shape."""
+    return {
+        "status": raw.get("status", "queued"),
+        "progress": int(raw.get("progress") or 0),
+        "total": int(raw.get("total") or 0),
+        "output_filename": raw.get("output_filename") or None,
+        "error": raw.get("error") or None,
+    }
+
+
+# In-memory job store (fallback mode, local single-process deployment)
 _jobs: Dict[str, dict] = {}
 _jobs_lock = threading.Lock()
 
+_NEW_JOB_STATE = {
+    "status": "queued",
+    "progress": 0,
+    "total": 0,
+    "output_filename": None,
+    "error": None,
+}
+
 
 def create_job() -> str:
     """Create a new job entry and return its UUID."""
     job_id = str(uuid.uuid4())
+    if _use_redis():
+        r = _get_redis()
+        key = _job_key(job_id)
+        r.hset(key, mapping=_to_redis_fields(_NEW_JOB_STATE))
+        r.expire(key, config.JOB_TTL_SECONDS)
+        return job_id
     with _jobs_lock:
-        _jobs[job_id] = {
+        _jobs[job_id] = dict(_NEW_JOB_STATE)
+    return job_id
+
+
+def get_job_status(job_id: str) -> Optional[dict]:
+    """
+    Return a copy of the job status dict, or None if not found.
+
+    In Celery mode, state comes from the result backend. Note Celery
+    reports unknown task ids as PENDING, so those show up as "queued"
+    rather than None.
+    """
+    if _use_celery():
+        from core.tasks import celery_app
+
+        result = celery_app.AsyncResult(job_id)
+        job = {
             "status": "queued",
             "progress": 0,
             "total": 0,
             "output_filename": None,
             "error": None,
         }
-    return job_id
+        info = result.info
+        if isinstance(info, dict):
+            job.update(info)
+        elif result.failed():
+            job.update(status="error", error=str(info))
+        return job
 
+    if _use_redis():
+        raw = _get_redis().hgetall(_job_key(job_id))
+        return _from_redis_fields(raw) if raw else None
 
-def get_job_status(job_id: str) -> Optional[dict]:
-    """Return a copy of the job status dict, or None if not found."""
     with _jobs_lock:
         job = _jobs.get(job_id)
         return dict(job) if job else None
 
 
+# Broadcast condition for push-style status updates (Server-Sent Events).
+# In-process updates notify immediately; the SSE stream's wait timeout
+# covers updates landing in Redis/Celery from other processes.
+_job_events = threading.Condition()
+
+
+def wait_for_job_update(timeout: float = 2.0) -> None:
+    """Block until any job update is broadcast, or the timeout elapses."""
+    with _job_events:
+        _job_events.wait(timeout)
+
+
 def _update_job(job_id: str, **kwargs) -> None:
-    with _jobs_lock:
-        if job_id in _jobs:
-            _jobs[job_id].update(kwargs)
+    if _use_redis():
+        r = _get_redis()
+        key = _job_key(job_id)
+        r.hset(key, mapping=_to_redis_fields(kwargs))
+        r.expire(key, config.JOB_TTL_SECONDS)  # refresh TTL on activity
+    else:
+        with _jobs_lock:
+            if job_id in _jobs:
+                _jobs[job_id].update(kwargs)
+    with _job_events:
+        _job_events.notify_all()
 
 
-def _run_pipeline(
-    job_id: str,
+# End-of-stream marker for the render queue
+_RENDER_DONE = object()
+
+
+def _iter_via_render_queue(
+    page_iter: Iterable[Tuple[int, bytes]],
+    depth: int,
+) -> Iterator[Tuple[int, bytes]]:
+    """
+    Run a page-rendering iterator in a dedicated producer thread.
+
+    Rendered pages flow through a bounded queue.Queue, so rendering of
+    page k+1 overlaps with OCR of page k instead of the two stages running
+    back to back — total wall-clock approaches max(render, ocr) rather
+    than their sum. The maxsize bound gives natural backpressure: the
+    renderer blocks when OCR falls behind, so buffered images never pile
+    up beyond `depth` pages.
+
+    Exceptions raised by the renderer are re-raised to the consumer once
+    the queue drains. If the consumer itself dies mid-stream (e.g. a
+    non-retryable OCR error), a cancel event unblocks the producer and
+    the rendering iterator is closed explicitly — otherwise the thread
+    would sit in q.put forever and the renderer's cleanup (its process
+    pool and open document handles) would leak per failed job.
+    """
+    q: queue.Queue = queue.Queue(maxsize=depth)
+    render_error: list = []
+    cancelled = threading.Event()
+
+    def put_unless_cancelled(item) -> bool:
+        """Bounded put that gives up once the consumer has cancelled."""
+        while not cancelled.is_set():
+            try:
+                q.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in page_iter:
+                if not put_unless_cancelled(item):
+                    return
+        except BaseException as exc:
+            render_error.append(exc)
+        finally:
+            # Run the iterator's own cleanup now (render pool shutdown,
+            # document close) instead of whenever GC finds it.
+            close = getattr(page_iter, "close", None)
+            if close is not None:
+                close()
+            put_unless_cancelled(_RENDER_DONE)
+
+    threading.Thread(target=produce, daemon=True).start()
+
+    try:
+        while True:
+            item = q.get()
+            if item is _RENDER_DONE:
+                break
+            yield item
+    finally:
+        cancelled.set()
+        # Drain anything buffered so a producer mid-put wakes up at once
+        while True:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                break
+
+    if render_error:
+        raise render_error[0]
+
+
+def run_conversion(
     pdf_path: str,
     output_filename: str,
     original_filename: str,
-) -> None:
+    on_update: Callable[[dict], None],
+) -> dict:
     """
-    Full conversion pipeline. Runs in a background thread.
+    Full conversion pipeline, independent of any particular job store.
+
+    Calls on_update({...}) with partial state dicts as the job advances,
+    so the caller (background thread or Celery task) decides how progress
+    is persisted.
 
     Steps:
-        1. Render PDF pages to PNG bytes (PyMuPDF)
-        2. Extract text from each page via Claude Vision (sequential)
+        1. Render PDF pages to JPEG bytes (PyMuPDF)
+        2. Extract text from each page via Claude Vision
         3. Assemble .docx with page breaks
         4. Delete the uploaded temp PDF
+
+    Returns:
+        The final state dict: {"status": "complete", ...} on success,
+        {"status": "error", "error": "<msg>"} on failure.
     """
     try:
-        _update_job(job_id, status="rendering_pages")
+        on_update({"status": "rendering_pages"})
 
-        pages_png = pdf_to_png_bytes_list(pdf_path, dpi=config.PDF_RENDER_DPI)
-        total_pages = len(pages_png)
-        _update_job(job_id, total=total_pages, status="running_ocr")
+        total_pages = pdf_page_count(pdf_path)
+        on_update({"total": total_pages, "status": "running_ocr"})
 
         def on_page_done(page_idx: int, total: int) -> None:
-            _update_job(job_id, progress=page_idx)
-
-        page_texts = extract_text_from_all_pages(
-            png_bytes_list=pages_png,
-            api_key=config.ANTHROPIC_API_KEY,
-            model=config.CLAUDE_MODEL,
-            prompt=config.CLAUDE_PROMPT,
-            progress_callback=on_page_done,
-        )
+            on_update({"progress": page_idx})
 
-        _update_job(job_id, progress=total_pages, status="building_docx")
+        # Large PDFs go through the Message Batches API (cheaper, one
+        # submit + poll); small ones stay on the lower-latency sync path,
+        # streaming pages from the renderer so only a handful of page
+        # images are in memory at any time.
+        if total_pages >= config.OCR_BATCH_PAGE_THRESHOLD:
+            page_texts = extract_text_from_all_pages_batched(
+                image_bytes_list=pdf_to_image_bytes_list(
+                    pdf_path,
+                    dpi=config.PDF_RENDER_DPI,
+                    jpg_quality=config.PAGE_JPEG_QUALITY,
+                    max_edge_px=config.PAGE_MAX_EDGE_PX,
+                    render_workers=config.PDF_RENDER_WORKERS,
+                ),
+                api_key=config.ANTHROPIC_API_KEY,
+                model=config.CLAUDE_MODEL,
+                prompt=config.CLAUDE_PROMPT,
+                progress_callback=on_page_done,
+            )
+        elif config.OCR_USE_ASYNC:
+            # Event-loop path: all in-flight requests share one thread.
+            # Trades the streaming renderer for a materialized page list,
+            # but scales to many concurrent jobs per process.
+            page_texts = asyncio.run(
+                extract_text_from_all_pages_async(
+                    image_bytes_list=pdf_to_image_bytes_list(
+                        pdf_path,
+                        dpi=config.PDF_RENDER_DPI,
+                        jpg_quality=config.PAGE_JPEG_QUALITY,
+                        max_edge_px=config.PAGE_MAX_EDGE_PX,
+                        render_workers=config.PDF_RENDER_WORKERS,
+                    ),
+                    api_key=config.ANTHROPIC_API_KEY,
+                    model=config.CLAUDE_MODEL,
+                    prompt=config.CLAUDE_PROMPT,
+                    progress_callback=on_page_done,
+                    max_workers=config.OCR_CONCURRENCY,
+                )
+            )
+        else:
+            page_texts = extract_text_from_page_iter(
+                pages=_iter_via_render_queue(
+                    iter_pdf_page_images(
+                        pdf_path,
+                        dpi=config.PDF_RENDER_DPI,
+                        jpg_quality=config.PAGE_JPEG_QUALITY,
+                        max_edge_px=config.PAGE_MAX_EDGE_PX,
+                        render_workers=config.PDF_RENDER_WORKERS,
+                    ),
+                    depth=config.RENDER_QUEUE_DEPTH,
+                ),
+                total=total_pages,
+                api_key=config.ANTHROPIC_API_KEY,
+                model=config.CLAUDE_MODEL,
+                prompt=config.CLAUDE_PROMPT,
+                progress_callback=on_page_done,
+                max_workers=config.OCR_CONCURRENCY,
+            )
+
+        on_update({"progress": total_pages, "status": "building_docx"})
 
         output_path = str(config.OUTPUT_DIR / output_filename)
         build_docx(
@@ -96,10 +365,19 @@ def _run_pipeline(
             source_filename=original_filename,
         )
 
-        _update_job(job_id, status="complete", output_filename=output_filename)
+        final = {
+            "status": "complete",
+            "progress": total_pages,
+            "total": total_pages,
+            "output_filename": output_filename,
+        }
+        on_update(final)
+        return final
 
     except Exception as exc:
-        _update_job(job_id, status="error", error=str(exc))
+        final = {"status": "error", "error": str(exc)}
+        on_update(final)
+        return final
 
     finally:
         # Clean up uploaded PDF regardless of success/failure
@@ -109,13 +387,33 @@ def _run_pipeline(
             pass
 
 
+def _run_pipeline(
+    job_id: str,
+    pdf_path: str,
+    output_filename: str,
+    original_filename: str,
+) -> None:
+    """Background-thread entry point: run the conversion, mirroring state into _jobs."""
+    run_conversion(
+        pdf_path,
+        output_filename,
+        original_filename,
+        on_update=lambda fields: _update_job(job_id, **fields),
+    )
+
+
 def start_processing_in_background(
     pdf_path: str,
     output_filename: str,
     original_filename: str,
 ) -> str:
     """
-    Create a job, start the background conversion thread, and return the job_id.
+    Start a conversion job and return its job_id.
+
+    With Celery enabled (config.USE_CELERY and the celery package
+    installed), the job is dispatched to a worker via the Redis broker —
+    state survives Flask restarts and jobs can run on separate machines.
+    Otherwise it falls back to an in-process background daemon thread.
 
     Args:
         pdf_path:          Absolute path to the saved upload PDF
@@ -125,6 +423,12 @@ def start_processing_in_background(
     Returns:
         job_id (str) — poll /status/<job_id> to track progress
     """
+    if _use_celery():
+        from core.tasks import run_pipeline_task
+
+        task = run_pipeline_task.delay(pdf_path, output_filename, original_filename)
+        return task.id
+
     job_id = create_job()
     thread = threading.Thread(
         target=_run_pipeline,
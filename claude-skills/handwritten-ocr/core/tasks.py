@@ -0,0 +1,57 @@
+"""
+Celery task wrapper for the conversion pipeline.
+
+Optional scaling path: with the celery package installed, a Redis broker
+running, and USE_CELERY=1 in the environment, uploads are dispatched to
+Celery workers instead of in-process threads. Job state then lives in the
+Celery result backend, so it survives Flask restarts, works across
+multiple gunicorn workers, and jobs can run on separate machines.
+
+Start a worker with:
+    celery -A core.tasks worker --loglevel=info
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from celery import Celery
+
+import config
+
+config.init()
+
+celery_app = Celery(
+    "handwritten_ocr",
+    broker=config.CELERY_BROKER_URL,
+    backend=config.CELERY_RESULT_BACKEND,
+)
+
+
+@celery_app.task(bind=True, name="handwritten_ocr.run_pipeline")
+def run_pipeline_task(
+    self,
+    pdf_path: str,
+    output_filename: str,
+    original_filename: str,
+) -> dict:
+    """
+    Run the full conversion on a worker, mirroring job state into the
+    Celery result backend via update_state so /status can poll it.
+    """
+    from core.processor import run_conversion
+
+    state = {
+        "status": "queued",
+        "progress": 0,
+        "total": 0,
+        "output_filename": None,
+        "error": None,
+    }
+
+    def on_update(fields: dict) -> None:
+        state.update(fields)
+        self.update_state(state="PROGRESS", meta=dict(state))
+
+    return run_conversion(pdf_path, output_filename, original_filename, on_update)
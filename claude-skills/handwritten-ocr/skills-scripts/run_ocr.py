@@ -15,7 +15,6 @@ Progress is printed to the terminal line by line.
 """
 
 import sys
-import os
 from pathlib import Path
 
 # Point to the handwritten_ocr app directory
@@ -45,6 +44,9 @@ else:
     output_path = input_path.with_suffix(".docx")
 
 # --- Load config (reads .env for ANTHROPIC_API_KEY) ---
+# config and the core modules (anthropic, fitz, …) are imported only
+# after argument validation, so bad invocations fail instantly instead
+# of paying a few hundred ms of import cost first.
 import config
 
 if not config.ANTHROPIC_API_KEY or config.ANTHROPIC_API_KEY.startswith("sk-ant-YOUR"):
@@ -54,10 +56,13 @@ if not config.ANTHROPIC_API_KEY or config.ANTHROPIC_API_KEY.startswith("sk-ant-Y
     sys.exit(1)
 
 # --- Import core modules ---
-from core.pdf_to_images import pdf_to_png_bytes_list
-from core.claude_ocr import extract_text_from_image
+from core.pdf_to_images import pdf_to_image_bytes_list
+from core.claude_ocr import configure_cache, extract_text_from_image
 from core.docx_builder import build_docx
 
+# Reuse cached transcriptions when the same pages were OCR'd before
+configure_cache(config.OCR_CACHE_DIR, config.OCR_PROMPT_VERSION)
+
 # --- Run conversion ---
 print(f"\nHandwritten OCR — CLI Mode")
 print(f"{'─' * 50}")
@@ -68,21 +73,26 @@ print(f"{'─' * 50}\n")
 
 print("Step 1/3  Rendering PDF pages to images...")
 try:
-    pages_png = pdf_to_png_bytes_list(str(input_path), dpi=config.PDF_RENDER_DPI)
+    page_images = pdf_to_image_bytes_list(
+        str(input_path),
+        dpi=config.PDF_RENDER_DPI,
+        jpg_quality=config.PAGE_JPEG_QUALITY,
+        max_edge_px=config.PAGE_MAX_EDGE_PX,
+    )
 except Exception as e:
     print(f"Error rendering PDF: {e}")
     sys.exit(1)
 
-total = len(pages_png)
+total = len(page_images)
 print(f"          {total} page(s) found.\n")
 
 print("Step 2/3  Extracting handwritten text with Claude Vision...")
 page_texts = []
-for i, png_bytes in enumerate(pages_png, start=1):
+for i, image_bytes in enumerate(page_images, start=1):
     print(f"          Page {i}/{total}...", end=" ", flush=True)
     try:
         text = extract_text_from_image(
-            png_bytes=png_bytes,
+            image_bytes=image_bytes,
             api_key=config.ANTHROPIC_API_KEY,
             model=config.CLAUDE_MODEL,
             prompt=config.CLAUDE_PROMPT,
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Batch CLI runner: convert many handwritten PDFs in one process.
+
+Usage:
+    python run_ocr_many.py a.pdf b.pdf c.pdf
+    python run_ocr_many.py ~/scans/*.pdf
+
+Compared to looping run_ocr.py in a shell, this pays the Python and SDK
+import cost once, reuses a single API client, and submits every page of
+every file as one Message Batch (batch requests are billed at a
+discount). Each output .docx is written next to its input PDF.
+"""
+
+import sys
+from pathlib import Path
+
+# Point to the handwritten_ocr app directory
+APP_DIR = Path("/Users/ranjithgonugunta/Documents/Python/claude-skills/handwritten-ocr")
+sys.path.insert(0, str(APP_DIR))
+
+# --- Validate arguments ---
+if len(sys.argv) < 2:
+    print("Usage: python run_ocr_many.py <input1.pdf> [input2.pdf ...]")
+    print("Example: python run_ocr_many.py ~/Desktop/notes/*.pdf")
+    sys.exit(1)
+
+input_paths = [Path(arg).expanduser().resolve() for arg in sys.argv[1:]]
+
+for path in input_paths:
+    if not path.exists():
+        print(f"Error: File not found: {path}")
+        sys.exit(1)
+    if path.suffix.lower() != ".pdf":
+        print(f"Error: Input must be a PDF file, got: {path.name}")
+        sys.exit(1)
+
+# --- Load config (reads .env for ANTHROPIC_API_KEY) ---
+# Imported only after argument validation so bad invocations fail fast.
+import config
+
+if not config.ANTHROPIC_API_KEY or config.ANTHROPIC_API_KEY.startswith("sk-ant-YOUR"):
+    print("Error: ANTHROPIC_API_KEY is not set.")
+    print(f"Add it to: {APP_DIR}/.env")
+    print('Format: ANTHROPIC_API_KEY=sk-ant-...')
+    sys.exit(1)
+
+# --- Import core modules ---
+from core.pdf_to_images import pdf_to_image_bytes_list
+from core.claude_ocr import configure_cache, extract_text_from_all_pages_batched
+from core.docx_builder import build_docx
+
+# Reuse cached transcriptions when the same pages were OCR'd before
+configure_cache(config.OCR_CACHE_DIR, config.OCR_PROMPT_VERSION)
+
+# --- Run conversion ---
+print(f"\nHandwritten OCR — Batch CLI Mode ({len(input_paths)} file(s))")
+print(f"{'─' * 50}")
+
+print("Step 1/3  Rendering PDF pages to images...")
+all_images = []        # pages from every file, concatenated
+page_ranges = []       # (start, end) slice of all_images per input file
+for path in input_paths:
+    try:
+        page_images = pdf_to_image_bytes_list(
+            str(path),
+            dpi=config.PDF_RENDER_DPI,
+            jpg_quality=config.PAGE_JPEG_QUALITY,
+            max_edge_px=config.PAGE_MAX_EDGE_PX,
+        )
+    except Exception as e:
+        print(f"Error rendering {path.name}: {e}")
+        sys.exit(1)
+    page_ranges.append((len(all_images), len(all_images) + len(page_images)))
+    all_images.extend(page_images)
+    print(f"          {path.name}: {len(page_images)} page(s)")
+
+total = len(all_images)
+print(f"          {total} page(s) total.\n")
+
+print("Step 2/3  Extracting handwritten text (one Message Batch)...")
+
+
+def show_progress(done: int, total_pages: int) -> None:
+    print(f"          {done}/{total_pages} page(s) done", flush=True)
+
+
+try:
+    all_texts = extract_text_from_all_pages_batched(
+        image_bytes_list=all_images,
+        api_key=config.ANTHROPIC_API_KEY,
+        model=config.CLAUDE_MODEL,
+        prompt=config.CLAUDE_PROMPT,
+        progress_callback=show_progress,
+    )
+except Exception as e:
+    print(f"Error during OCR: {e}")
+    sys.exit(1)
+
+print(f"\nStep 3/3  Building Word documents...")
+for path, (start, end) in zip(input_paths, page_ranges):
+    output_path = path.with_suffix(".docx")
+    try:
+        build_docx(
+            page_texts=all_texts[start:end],
+            output_path=str(output_path),
+            source_filename=path.name,
+        )
+        print(f"          {output_path}")
+    except Exception as e:
+        print(f"Error building {output_path.name}: {e}")
+
+print(f"\n{'─' * 50}")
+print(f"Done!  {len(input_paths)} document(s) written.")
+print(f"{'─' * 50}\n")
@@ -11,13 +11,55 @@ Usage:
     python pdf_operations.py repair corrupted.pdf -o repaired.pdf
 """
 
-import PyPDF2
-import subprocess
-import shutil
+import io
+import logging
+import os
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import List, Optional, Tuple
-from PyPDF2.errors import PdfReadError
+
+# PyPDF2 (and subprocess/shutil for the repair tools) are imported
+# inside the functions that need them: --help and argument errors then
+# return instantly instead of paying ~100ms of PDF-stack import first.
+
+# Messages go through a logger so the %-formatting is skipped entirely
+# when the level is above the call site — per-iteration progress lines
+# cost nothing when quiet. main() attaches the CLI handler.
+logger = logging.getLogger(__name__)
+
+# Info-dictionary keys surfaced by get_pdf_info, built once at module scope
+_DOCINFO_KEYS = ('/Title', '/Author', '/Subject', '/Creator', '/Producer')
+
+
+def _quick_validate(data: bytes) -> bool:
+    """
+    Cheap structural sanity check before the full PyPDF2 parse.
+
+    Handing a truncated or non-PDF file to PdfReader tokenizes the
+    whole xref/trailer just to raise PdfReadError. Checking the magic
+    header and an %%EOF marker in the last kilobyte catches the obvious
+    cases for the cost of two slices, so known-bad inputs go straight
+    to repair.
+    """
+    return data.startswith(b'%PDF-') and b'%%EOF' in data[-1024:]
+
+
+@lru_cache(maxsize=None)
+def _tool_path(name: str) -> Optional[str]:
+    """
+    Resolve an external tool (gs, qpdf) once per process.
+
+    shutil.which walks every PATH entry with a stat per candidate —
+    tens of syscalls — which compounds when repair runs per file in a
+    batch. Tool availability doesn't change mid-process, so cache it.
+    """
+    import shutil
+    return shutil.which(name)
+
+# Inputs appended between writer compactions on the PyPDF2 merge path
+_MERGE_COMPACT_EVERY = 50
 
 
 def repair_with_pikepdf(input_path: str, repaired_path: str) -> bool:
@@ -34,16 +76,56 @@ def repair_with_pikepdf(input_path: str, repaired_path: str) -> bool:
     try:
         import pikepdf
     except ImportError:
-        print("⚠️  pikepdf not installed. Install with: pip install pikepdf")
+        logger.warning("⚠️  pikepdf not installed. Install with: pip install pikepdf")
         return False
 
     try:
         with pikepdf.open(input_path) as pdf:
+            # Plain save(): qpdf's default settings produce output PyPDF2
+            # can always reparse. Compressed object streams are smaller
+            # but PyPDF2 (and pikepdf itself) can fail to reopen them
+            # when the input was badly truncated.
             pdf.save(repaired_path)
-        print(f"✓ Repaired with pikepdf: {repaired_path}")
+        logger.info("✓ Repaired with pikepdf: %s", repaired_path)
+        return True
+    except Exception as e:
+        logger.error("✗ pikepdf repair failed: %s", e)
+        return False
+
+
+def repair_with_qpdf(input_path: str, repaired_path: str) -> bool:
+    """
+    Attempt structural repair using the qpdf CLI.
+
+    qpdf rewrites the document with its recovery parser — fixing xref
+    tables and stream lengths without touching page content — so it runs
+    orders of magnitude faster than Ghostscript's full re-encode.
+
+    Args:
+        input_path: Path to the corrupted PDF
+        repaired_path: Path where repaired PDF should be saved
+
+    Returns:
+        True on success, False otherwise
+    """
+    import subprocess
+
+    qpdf = _tool_path('qpdf')
+    if not qpdf:
+        logger.warning("⚠️  qpdf not found. Install with: brew install qpdf")
+        return False
+
+    try:
+        subprocess.run([
+            qpdf,
+            '--empty',
+            '--pages', input_path, '1-z', '--',
+            repaired_path
+        ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        logger.info("✓ Repaired with qpdf: %s", repaired_path)
         return True
     except Exception as e:
-        print(f"✗ pikepdf repair failed: {e}")
+        logger.error("✗ qpdf repair failed: %s", e)
         return False
 
 
@@ -51,6 +133,9 @@ def repair_with_ghostscript(input_path: str, repaired_path: str) -> bool:
     """
     Attempt to repair using Ghostscript (gs).
 
+    Heavyweight last resort: gs re-encodes every image and font at print
+    resolution, so prefer repair_with_qpdf for structural fix-ups.
+
     Args:
         input_path: Path to the corrupted PDF
         repaired_path: Path where repaired PDF should be saved
@@ -58,9 +143,11 @@ def repair_with_ghostscript(input_path: str, repaired_path: str) -> bool:
     Returns:
         True on success, False otherwise
     """
-    gs = shutil.which('gs')
+    import subprocess
+
+    gs = _tool_path('gs')
     if not gs:
-        print("⚠️  Ghostscript not found. Install with: brew install ghostscript")
+        logger.warning("⚠️  Ghostscript not found. Install with: brew install ghostscript")
         return False
 
     try:
@@ -71,53 +158,140 @@ def repair_with_ghostscript(input_path: str, repaired_path: str) -> bool:
             '-dPDFSETTINGS=/prepress',
             input_path
         ], check=True, capture_output=True, text=True)
-        print(f"✓ Repaired with Ghostscript: {repaired_path}")
+        logger.info("✓ Repaired with Ghostscript: %s", repaired_path)
         return True
     except subprocess.CalledProcessError as e:
-        print(f"✗ Ghostscript repair failed: {e.stderr}")
+        logger.error("✗ Ghostscript repair failed: %s", e.stderr)
         return False
     except Exception as e:
-        print(f"✗ Ghostscript repair failed: {e}")
+        logger.error("✗ Ghostscript repair failed: %s", e)
         return False
 
 
-def open_pdf_with_repair(path: str) -> Tuple[Optional[PyPDF2.PdfReader], Optional[str]]:
+def repair_with_ghostscript_async(
+    input_path: str, repaired_path: str
+) -> Optional["subprocess.Popen"]:
+    """
+    Launch a Ghostscript repair without waiting for it.
+
+    gs runs in its own process, so the interpreter is free to keep
+    parsing other files while the repair proceeds. Batch pipelines can
+    start every repair up front, work through the inputs that opened
+    cleanly, then wait() on the handles.
+
+    Args:
+        input_path: Path to the corrupted PDF
+        repaired_path: Path where repaired PDF should be saved
+
+    Returns:
+        The Popen handle (returncode 0 means success), or None when gs
+        is not installed
+    """
+    import subprocess
+
+    gs = _tool_path('gs')
+    if not gs:
+        logger.warning("⚠️  Ghostscript not found. Install with: brew install ghostscript")
+        return None
+
+    try:
+        return subprocess.Popen([
+            gs,
+            '-o', repaired_path,
+            '-sDEVICE=pdfwrite',
+            '-dPDFSETTINGS=/prepress',
+            input_path
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError as e:
+        logger.error("✗ Could not launch Ghostscript: %s", e)
+        return None
+
+
+def repair_to_buffer(input_path: str) -> Optional[io.BytesIO]:
+    """
+    Repair a PDF with pikepdf straight into memory.
+
+    Avoids the disk round trip of writing a *_repaired.pdf and reading
+    it back — the repaired bytes go directly to the caller.
+
+    Args:
+        input_path: Path to the corrupted PDF
+
+    Returns:
+        BytesIO positioned at 0 on success, None otherwise
+    """
+    try:
+        import pikepdf
+    except ImportError:
+        logger.warning("⚠️  pikepdf not installed. Install with: pip install pikepdf")
+        return None
+
+    try:
+        with pikepdf.open(input_path) as pdf:
+            buf = io.BytesIO()
+            pdf.save(buf)
+        buf.seek(0)
+        logger.info("✓ Repaired with pikepdf (in memory)")
+        return buf
+    except Exception as e:
+        logger.error("✗ pikepdf repair failed: %s", e)
+        return None
+
+
+def open_pdf_with_repair(path: str) -> Tuple["PyPDF2.PdfReader", bool, Optional[str]]:
     """
     Try opening a PDF with PyPDF2, attempting repair if needed.
 
+    The file is slurped and parsed from memory (PdfReader reads its
+    stream lazily, so handing it an open file handle leaks the
+    descriptor — and closing it early would break page access). pikepdf
+    repair happens entirely in memory; only the Ghostscript fallback
+    still writes a *_repaired.pdf to disk.
+
     Args:
         path: Path to the PDF file
 
     Returns:
-        Tuple of (PdfReader object, path to repaired file if repair was needed)
+        Tuple of (PdfReader object, whether repair was needed,
+        path to the repaired file when one was written to disk)
 
     Raises:
         RuntimeError: If PDF cannot be opened or repaired
     """
+    import PyPDF2
+    from PyPDF2.errors import PdfReadError
+
     # First try to read normally
     try:
-        pdf_reader = PyPDF2.PdfReader(open(path, 'rb'))
-        return pdf_reader, None
+        with open(path, 'rb') as fh:
+            data = fh.read()
+        if not _quick_validate(data):
+            raise PdfReadError('missing %PDF header or %%EOF marker')
+        return PyPDF2.PdfReader(io.BytesIO(data)), False, None
     except (OSError, PdfReadError, ValueError) as e:
-        print(f"⚠️  Failed to open PDF directly: {e}")
-        print(f"   Attempting repair...")
-
-        # Attempt repairs
-        repaired = str(Path(path).with_suffix('')) + '_repaired.pdf'
-        repaired_done = False
-
-        if repair_with_pikepdf(path, repaired):
-            repaired_done = True
-        elif repair_with_ghostscript(path, repaired):
-            repaired_done = True
-
-        if not repaired_done:
-            raise RuntimeError(f"Failed to read PDF and all repair attempts failed")
+        logger.warning("⚠️  Failed to open PDF directly: %s", e)
+        logger.warning("   Attempting repair...")
+
+        # In-memory pikepdf repair first — no disk round trip
+        buf = repair_to_buffer(path)
+        if buf is not None:
+            try:
+                return PyPDF2.PdfReader(buf), True, None
+            except Exception:
+                pass
+
+        # qpdf structural repair, then Ghostscript as heavy last resort.
+        # Plain string slicing: building a Path just to strip the suffix
+        # allocates and re-parses the whole string.
+        repaired = (path[:-4] if path.endswith('.pdf') else path) + '_repaired.pdf'
+        if not repair_with_qpdf(path, repaired):
+            if not repair_with_ghostscript(path, repaired):
+                raise RuntimeError(f"Failed to read PDF and all repair attempts failed")
 
-        # Try reading the repaired file
         try:
-            pdf_reader = PyPDF2.PdfReader(open(repaired, 'rb'))
-            return pdf_reader, repaired
+            with open(repaired, 'rb') as fh:
+                data = fh.read()
+            return PyPDF2.PdfReader(io.BytesIO(data)), True, repaired
         except Exception as e2:
             raise RuntimeError(f"Reading repaired PDF failed: {e2}")
 
@@ -126,30 +300,29 @@ def extract_pages(
     input_path: str,
     output_path: str,
     start_page: int,
-    end_page: int,
-    verbose: bool = True
+    end_page: int
 ) -> dict:
     """
     Extract pages from a PDF to a new PDF with automatic repair if needed.
 
+    Progress goes through the module logger: summaries at INFO,
+    per-step detail at DEBUG (enable with --verbose on the CLI).
+
     Args:
         input_path: Path to the source PDF
         output_path: Path for the output PDF
         start_page: Starting page number (0-indexed)
         end_page: Ending page number (0-indexed, inclusive)
-        verbose: Print progress information
 
     Returns:
         Dictionary with operation status and metadata
     """
-    if verbose:
-        print(f"\n📄 Extracting pages from: {input_path}")
+    logger.info("\n📄 Extracting pages from: %s", input_path)
 
-    pdf_reader, repaired_path = open_pdf_with_repair(input_path)
+    pdf_reader, repaired, repaired_path = open_pdf_with_repair(input_path)
     total_pages = len(pdf_reader.pages)
 
-    if verbose:
-        print(f"   Total pages in source: {total_pages}")
+    logger.debug("   Total pages in source: %s", total_pages)
 
     # Ensure the start_page and end_page are within the valid range
     original_start = start_page
@@ -159,17 +332,48 @@ def extract_pages(
     end_page = min(end_page, total_pages - 1)
 
     if start_page != original_start or end_page != original_end:
-        if verbose:
-            print(f"   ⚠️  Adjusted page range from {original_start}-{original_end} to {start_page}-{end_page}")
+        logger.warning(
+            "   ⚠️  Adjusted page range from %s-%s to %s-%s",
+            original_start, original_end, start_page, end_page
+        )
+
+    if start_page == 0 and end_page == total_pages - 1 and not repaired:
+        # Whole-document "extract" of a healthy file: a byte copy is
+        # identical and skips the reparse-and-rewrite entirely
+        # (copyfile uses sendfile/copy_file_range on Linux).
+        import shutil
+        shutil.copyfile(input_path, output_path)
+
+        result = {
+            'status': 'success',
+            'input_file': input_path,
+            'output_file': output_path,
+            'total_pages_in_source': total_pages,
+            'pages_extracted': total_pages,
+            'page_range': f"{start_page}-{end_page}",
+            'repair_needed': repaired,
+            'repaired_file': repaired_path
+        }
+
+        logger.info("\n✓ Success!")
+        logger.info("   Requested range covers the whole document — copied bytes directly")
+        logger.info("   Output: %s", output_path)
+
+        return result
 
-    # Create a new PDF writer and add the selected pages
+    # Append the selected range in one call: add_page re-walks the
+    # writer's object graph per insertion (O(n²) over the range), while
+    # append resolves shared resources once.
+    import PyPDF2
     pdf_writer = PyPDF2.PdfWriter()
-    for page_num in range(start_page, end_page + 1):
-        pdf_writer.add_page(pdf_reader.pages[page_num])
+    pdf_writer.append(pdf_reader, pages=(start_page, end_page + 1))
 
-    # Write the new PDF to the output file
-    with open(output_path, 'wb') as output_file:
-        pdf_writer.write(output_file)
+    # Serialize into memory first: PyPDF2 emits many small writes per
+    # object, so writing to a raw file handle means a syscall storm.
+    # One write_bytes flushes the whole document in large blocks.
+    buf = io.BytesIO()
+    pdf_writer.write(buf)
+    Path(output_path).write_bytes(buf.getbuffer())
 
     result = {
         'status': 'success',
@@ -178,34 +382,88 @@ def extract_pages(
         'total_pages_in_source': total_pages,
         'pages_extracted': end_page - start_page + 1,
         'page_range': f"{start_page}-{end_page}",
-        'repair_needed': repaired_path is not None,
+        'repair_needed': repaired,
         'repaired_file': repaired_path
     }
 
-    if verbose:
-        print(f"\n✓ Success!")
-        print(f"   Extracted {result['pages_extracted']} pages (range: {start_page+1}-{end_page+1} in viewer)")
-        print(f"   Output: {output_path}")
-        if repaired_path:
-            print(f"   ⚠️  Repair was needed, repaired file: {repaired_path}")
+    logger.info("\n✓ Success!")
+    logger.info(
+        "   Extracted %s pages (range: %s-%s in viewer)",
+        result['pages_extracted'], start_page + 1, end_page + 1
+    )
+    logger.info("   Output: %s", output_path)
+    if repaired:
+        logger.warning(
+            "   ⚠️  Repair was needed%s",
+            f", repaired file: {repaired_path}" if repaired_path else " (in memory)"
+        )
 
     return result
 
 
+def _compact_writer(pdf_writer) -> "PyPDF2.PdfWriter":
+    """
+    Round-trip the accumulated writer through its serialized form.
+
+    PyPDF2 keeps every appended object as a full Python structure, so a
+    writer holding hundreds of inputs can dwarf the eventual output
+    file. Serializing and rebuilding bounds peak memory on very large
+    merges. (The pikepdf repair path never needs this — qpdf copies
+    pages by reference.)
+    """
+    import PyPDF2
+
+    buf = io.BytesIO()
+    pdf_writer.write(buf)
+    buf.seek(0)
+    compacted = PyPDF2.PdfWriter()
+    compacted.append_pages_from_reader(PyPDF2.PdfReader(buf))
+    return compacted
+
+
+def _load_and_serialize(path: str, auto_repair: bool) -> Tuple[bytes, int, bool]:
+    """
+    Pool worker for merge_pdfs: parse one input PDF and hand back its
+    re-serialized bytes plus page count and whether repair kicked in.
+
+    Only bytes cross the process boundary — PdfReader objects don't
+    pickle. Workers inherit no log handler, so their output stays quiet.
+    """
+    import PyPDF2
+
+    if auto_repair:
+        pdf_reader, repaired, _ = open_pdf_with_repair(path)
+    else:
+        pdf_reader = PyPDF2.PdfReader(path)
+        repaired = False
+
+    pdf_writer = PyPDF2.PdfWriter()
+    pdf_writer.append_pages_from_reader(pdf_reader)
+    buf = io.BytesIO()
+    pdf_writer.write(buf)
+    return buf.getvalue(), len(pdf_reader.pages), repaired
+
+
 def merge_pdfs(
     input_paths: List[str],
     output_path: str,
     auto_repair: bool = True,
-    verbose: bool = True
+    *,
+    workers: int = min(os.cpu_count() or 1, 8)
 ) -> dict:
     """
     Merge multiple PDF files into a single PDF.
 
+    With more than one input, the CPU-bound PyPDF2 parsing runs in a
+    process pool (the GIL never releases during parsing, so threads
+    wouldn't help); the main process appends each result in input order.
+    Inputs go out in bounded batches to cap peak memory on big merges.
+
     Args:
         input_paths: List of paths to PDF files to merge
         output_path: Path for the merged output PDF
         auto_repair: Whether to attempt repair on corrupted PDFs
-        verbose: Print progress information
+        workers: Worker processes for parsing inputs (1 = serial)
 
     Returns:
         Dictionary with operation status and metadata
@@ -213,39 +471,74 @@ def merge_pdfs(
     if not input_paths:
         raise ValueError("No input files provided")
 
-    if verbose:
-        print(f"\n📑 Merging {len(input_paths)} PDF files...")
+    logger.info("\n📑 Merging %s PDF files...", len(input_paths))
 
+    import PyPDF2
     pdf_writer = PyPDF2.PdfWriter()
     files_info = []
 
-    for idx, path in enumerate(input_paths, 1):
-        if verbose:
-            print(f"   [{idx}/{len(input_paths)}] Processing: {Path(path).name}")
-
-        if auto_repair:
-            pdf_reader, repaired_path = open_pdf_with_repair(path)
-        else:
-            pdf_reader = PyPDF2.PdfReader(path)
-            repaired_path = None
-
-        page_count = len(pdf_reader.pages)
-
-        for page_num in range(page_count):
-            page = pdf_reader.pages[page_num]
-            pdf_writer.add_page(page)
-
-        files_info.append({
-            'file': path,
-            'pages': page_count,
-            'repaired': repaired_path is not None
-        })
-
-        if verbose and repaired_path:
-            print(f"       ⚠️  Repair was needed")
-
-    with open(output_path, 'wb') as output_file:
-        pdf_writer.write(output_file)
+    workers = min(workers, len(input_paths))
+    if workers > 1:
+        load = partial(_load_and_serialize, auto_repair=auto_repair)
+        batch_size = workers * 2
+        idx = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for start in range(0, len(input_paths), batch_size):
+                batch = input_paths[start:start + batch_size]
+                for path, (blob, page_count, repaired) in zip(
+                    batch, executor.map(load, batch)
+                ):
+                    idx += 1
+                    logger.debug(
+                        "   [%s/%s] Processing: %s",
+                        idx, len(input_paths), os.path.basename(path)
+                    )
+
+                    pdf_reader = PyPDF2.PdfReader(io.BytesIO(blob))
+                    pdf_writer.append_pages_from_reader(pdf_reader)
+                    files_info.append({
+                        'file': path,
+                        'pages': page_count,
+                        'repaired': repaired
+                    })
+
+                    if repaired:
+                        logger.warning("       ⚠️  Repair was needed")
+
+                    if len(files_info) % _MERGE_COMPACT_EVERY == 0:
+                        pdf_writer = _compact_writer(pdf_writer)
+    else:
+        for idx, path in enumerate(input_paths, 1):
+            logger.debug(
+                "   [%s/%s] Processing: %s",
+                idx, len(input_paths), os.path.basename(path)
+            )
+
+            if auto_repair:
+                pdf_reader, repaired, _ = open_pdf_with_repair(path)
+            else:
+                pdf_reader = PyPDF2.PdfReader(path)
+                repaired = False
+
+            page_count = len(pdf_reader.pages)
+            pdf_writer.append_pages_from_reader(pdf_reader)
+
+            files_info.append({
+                'file': path,
+                'pages': page_count,
+                'repaired': repaired
+            })
+
+            if repaired:
+                logger.warning("       ⚠️  Repair was needed")
+
+            if len(files_info) % _MERGE_COMPACT_EVERY == 0:
+                pdf_writer = _compact_writer(pdf_writer)
+
+    # Buffer the serialized output and flush it in one write
+    buf = io.BytesIO()
+    pdf_writer.write(buf)
+    Path(output_path).write_bytes(buf.getbuffer())
 
     total_pages = sum(info['pages'] for info in files_info)
 
@@ -257,54 +550,82 @@ def merge_pdfs(
         'files_info': files_info
     }
 
-    if verbose:
-        print(f"\n✓ Success!")
-        print(f"   Merged {len(input_paths)} files with {total_pages} total pages")
-        print(f"   Output: {output_path}")
+    logger.info("\n✓ Success!")
+    logger.info("   Merged %s files with %s total pages", len(input_paths), total_pages)
+    logger.info("   Output: %s", output_path)
 
     return result
 
 
-def get_pdf_info(pdf_path: str, verbose: bool = True) -> dict:
+def get_pdf_info(pdf_path: str) -> dict:
     """
     Get information about a PDF file.
 
     Args:
         pdf_path: Path to the PDF file
-        verbose: Print information
 
     Returns:
         Dictionary with PDF metadata and information
     """
-    pdf_reader, repaired_path = open_pdf_with_repair(pdf_path)
-
-    metadata = pdf_reader.metadata
-    info = {
-        'file': pdf_path,
-        'total_pages': len(pdf_reader.pages),
-        'repair_needed': repaired_path is not None,
-        'metadata': {}
-    }
+    try:
+        import pikepdf
+    except ImportError:
+        pikepdf = None
 
-    if metadata:
-        info['metadata'] = {
-            'title': metadata.get('/Title', 'N/A'),
-            'author': metadata.get('/Author', 'N/A'),
-            'subject': metadata.get('/Subject', 'N/A'),
-            'creator': metadata.get('/Creator', 'N/A'),
-            'producer': metadata.get('/Producer', 'N/A'),
+    info = None
+    if pikepdf is not None:
+        # qpdf decodes the info dictionary in C and exposes it as a
+        # plain mapping — no per-key IndirectObject resolution, which
+        # is the hot loop when listing a directory of PDFs.
+        try:
+            with pikepdf.open(pdf_path) as pdf:
+                docinfo = pdf.docinfo
+                # qpdf patches up mildly damaged files while parsing and
+                # records warnings when it does — surface that instead of
+                # claiming the file was clean.
+                repaired = bool(
+                    pdf.get_warnings() if hasattr(pdf, 'get_warnings') else ()
+                )
+                info = {
+                    'file': pdf_path,
+                    'total_pages': len(pdf.pages),
+                    'repair_needed': repaired,
+                    'metadata': {
+                        key[1:].lower(): str(docinfo.get(key, 'N/A'))
+                        for key in _DOCINFO_KEYS
+                    },
+                }
+        except Exception:
+            # pikepdf couldn't open it — fall through to the full
+            # PyPDF2 + repair chain rather than leaking a PdfError.
+            info = None
+
+    if info is None:
+        pdf_reader, repaired, _ = open_pdf_with_repair(pdf_path)
+
+        metadata = pdf_reader.metadata
+        info = {
+            'file': pdf_path,
+            'total_pages': len(pdf_reader.pages),
+            'repair_needed': repaired,
+            'metadata': {}
         }
 
-    if verbose:
-        print(f"\n📄 PDF Information")
-        print(f"   File: {Path(pdf_path).name}")
-        print(f"   Total pages: {info['total_pages']}")
-        if info['metadata'].get('title') != 'N/A':
-            print(f"   Title: {info['metadata']['title']}")
-        if info['metadata'].get('author') != 'N/A':
-            print(f"   Author: {info['metadata']['author']}")
-        if repaired_path:
-            print(f"   ⚠️  Repair was needed")
+        if metadata:
+            info['metadata'] = {
+                key[1:].lower(): metadata.get(key, 'N/A')
+                for key in _DOCINFO_KEYS
+            }
+
+    logger.info("\n📄 PDF Information")
+    logger.info("   File: %s", os.path.basename(pdf_path))
+    logger.info("   Total pages: %s", info['total_pages'])
+    if info['metadata'].get('title') != 'N/A':
+        logger.info("   Title: %s", info['metadata']['title'])
+    if info['metadata'].get('author') != 'N/A':
+        logger.info("   Author: %s", info['metadata']['author'])
+    if repaired:
+        logger.warning("   ⚠️  Repair was needed")
 
     return info
 
@@ -314,6 +635,8 @@ def main():
     parser = argparse.ArgumentParser(
         description='PDF manipulation tool for merging, extracting, and repairing PDFs'
     )
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Show per-file progress')
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
 
     # Merge command
@@ -339,6 +662,14 @@ def main():
 
     args = parser.parse_args()
 
+    # One plain-message handler for CLI runs. Per-file DEBUG lines are
+    # formatted only under --verbose; library importers attach their own
+    # handlers (or none) instead.
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG if args.verbose else logging.INFO)
+
     try:
         if args.command == 'merge':
             merge_pdfs(args.files, args.output)
@@ -348,10 +679,12 @@ def main():
             get_pdf_info(args.file)
         elif args.command == 'repair':
             repaired = repair_with_pikepdf(args.input, args.output)
+            if not repaired:
+                repaired = repair_with_qpdf(args.input, args.output)
             if not repaired:
                 repaired = repair_with_ghostscript(args.input, args.output)
             if not repaired:
-                print("✗ All repair attempts failed")
+                logger.error("✗ All repair attempts failed")
                 return 1
         else:
             parser.print_help()
@@ -360,7 +693,7 @@ def main():
         return 0
 
     except Exception as e:
-        print(f"\n✗ Error: {e}")
+        logger.error("\n✗ Error: %s", e)
         return 1
 
 
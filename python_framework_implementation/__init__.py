@@ -15,17 +15,33 @@ class SkillRegistry:
 
     def __init__(self):
         self._skills: Dict[str, Any] = {}
+        self._skills_info: Dict[str, Dict[str, Any]] = {}
 
     def register(self, name: str, skill_class: Any):
         """Register a skill with the registry.
 
+        Skill metadata (public methods, description) is computed here,
+        once per registration, rather than on every list_skills() call:
+        dir() + getattr() re-walk the whole MRO and can trigger
+        descriptors, which is pure overhead for a registry queried per
+        request.
+
         Args:
             name: Unique identifier for the skill
             skill_class: The skill class to register
         """
         if name in self._skills:
             raise ValueError(f"Skill '{name}' is already registered")
+        cls = skill_class if inspect.isclass(skill_class) else type(skill_class)
         self._skills[name] = skill_class
+        self._skills_info[name] = {
+            'name': name,
+            'description': getattr(skill_class, '__doc__', None) or 'No description',
+            'methods': tuple(
+                attr for attr, value in vars(cls).items()
+                if not attr.startswith('_') and callable(value)
+            )
+        }
         print(f"✓ Registered skill: {name}")
 
     def get(self, name: str) -> Any:
@@ -47,18 +63,14 @@ class SkillRegistry:
     def list_skills(self) -> Dict[str, Dict[str, Any]]:
         """List all registered skills with their metadata.
 
+        Returns the metadata precomputed at register() time, so calling
+        this repeatedly costs a dict copy rather than re-introspecting
+        every skill class.
+
         Returns:
             Dictionary of skill names to their metadata
         """
-        skills_info = {}
-        for name, skill_class in self._skills.items():
-            skills_info[name] = {
-                'name': name,
-                'description': getattr(skill_class, '__doc__', 'No description'),
-                'methods': [method for method in dir(skill_class)
-                           if not method.startswith('_') and callable(getattr(skill_class, method))]
-            }
-        return skills_info
+        return dict(self._skills_info)
 
     def auto_discover(self, package_name: str = 'skills'):
         """Auto-discover and register skills from a package.
@@ -115,6 +115,9 @@ def example_batch_processing():
     print("EXAMPLE 4: Batch Processing")
     print("="*60)
 
+    import os
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
     pdf = get_skill('pdf')
 
     # Suppose you have a directory with multiple PDFs
@@ -128,21 +131,35 @@ def example_batch_processing():
 
     output_dir = '/path/to/output/'
 
-    for pdf_file in pdf_files:
-        input_path = Path(pdf_file)
-        output_path = Path(output_dir) / f"{input_path.stem}_first_5_pages.pdf"
-
-        try:
-            result = pdf.extract_pages(
-                input_path=str(input_path),
-                output_path=str(output_path),
+    # Each file is independent CPU-bound work, so fan the extracts out
+    # across worker processes. PDFSkill carries no mutable state, so the
+    # instance pickles safely into workers.
+    #
+    # Plain os.path calls in the loop: constructing a Path object per
+    # file just to read its stem adds up over thousands of inputs.
+    workers = min(os.cpu_count() or 1, len(pdf_files))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for pdf_file in pdf_files:
+            name = os.path.basename(pdf_file)
+            stem = os.path.splitext(name)[0]
+            output_path = os.path.join(output_dir, f"{stem}_first_5_pages.pdf")
+            future = executor.submit(
+                pdf.extract_pages,
+                input_path=pdf_file,
+                output_path=output_path,
                 start_page=0,
                 end_page=4  # First 5 pages (0-4)
             )
-            print(f"✓ Processed: {input_path.name} -> {output_path.name}")
-
-        except Exception as e:
-            print(f"✗ Failed to process {input_path.name}: {e}")
+            futures[future] = (name, output_path)
+
+        for future in as_completed(futures):
+            name, output_path = futures[future]
+            try:
+                future.result()
+                print(f"✓ Processed: {name} -> {os.path.basename(output_path)}")
+            except Exception as e:
+                print(f"✗ Failed to process {name}: {e}")
 
 
 def example_using_skill_manager():
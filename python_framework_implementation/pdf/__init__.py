@@ -1,15 +1,22 @@
 """
 PDF Skill - PDF manipulation capabilities including merge, extract, and repair.
-"""
 
-from .pdf_class import PDFSkill
+The skill class is exported lazily (PEP 562): registry auto-discovery
+and list_skills() read only the metadata below, so they never trigger
+the PDF implementation import.
+"""
 
 # Skill metadata
 SKILL_NAME = 'pdf'
 SKILL_VERSION = '1.0.0'
 SKILL_DESCRIPTION = 'PDF manipulation: merge multiple PDFs, extract page ranges, repair corrupted files'
 
-# Export the skill class
-skill_class = PDFSkill
+__all__ = ['PDFSkill', 'skill_class', 'SKILL_NAME', 'SKILL_VERSION', 'SKILL_DESCRIPTION']
+
 
-__all__ = ['PDFSkill', 'SKILL_NAME', 'SKILL_VERSION', 'SKILL_DESCRIPTION']
+def __getattr__(name):
+    """Resolve PDFSkill/skill_class on first access instead of at import."""
+    if name in ('PDFSkill', 'skill_class'):
+        from .pdf_class import PDFSkill
+        return PDFSkill
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
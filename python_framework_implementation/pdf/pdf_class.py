@@ -1,13 +1,69 @@
 """
 PDF Skill - Core implementation for PDF manipulation operations.
+
+Heavy dependencies (PyPDF2, pikepdf) are imported at call time rather
+than module load: skill discovery and list_skills() shouldn't pay
+~100ms of import and several MB of RSS in processes that never touch
+a PDF.
 """
 
-import PyPDF2
-import subprocess
-import shutil
+import io
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import List, Optional, Tuple
-from PyPDF2.errors import PdfReadError
+
+
+@lru_cache(maxsize=1)
+def _get_pikepdf():
+    """
+    Import and return pikepdf on first use, or None if not installed.
+
+    pikepdf wraps qpdf (C++), where copying a page between documents is
+    a reference-level operation instead of PyPDF2's pure-Python walk of
+    the page's whole object graph — on large documents that's an order
+    of magnitude. It's optional: without it the PyPDF2 paths are used.
+    """
+    try:
+        import pikepdf
+        return pikepdf
+    except ImportError:
+        return None
+
+
+# Info-dictionary keys surfaced by get_info, built once at module scope
+_DOCINFO_KEYS = ('/Title', '/Author', '/Subject', '/Creator', '/Producer')
+
+
+def _quick_validate(data: bytes) -> bool:
+    """
+    Cheap structural sanity check before the full PyPDF2 parse.
+
+    Handing a truncated or non-PDF file to PdfReader tokenizes the
+    whole xref/trailer just to raise PdfReadError. Checking the magic
+    header and an %%EOF marker in the last kilobyte catches the obvious
+    cases for the cost of two slices, so known-bad inputs go straight
+    to repair.
+    """
+    return data.startswith(b'%PDF-') and b'%%EOF' in data[-1024:]
+
+
+@lru_cache(maxsize=None)
+def _tool_path(name: str) -> Optional[str]:
+    """
+    Resolve an external tool (gs, qpdf) once per process.
+
+    shutil.which walks every PATH entry with a stat per candidate —
+    tens of syscalls — which compounds when repair runs per file in a
+    batch. Tool availability doesn't change mid-process, so cache it.
+    """
+    import shutil
+    return shutil.which(name)
+
+# Inputs appended between writer compactions on the PyPDF2 merge path
+_MERGE_COMPACT_EVERY = 50
 
 
 class PDFSkill:
@@ -36,22 +92,62 @@ class PDFSkill:
         Returns:
             True on success, False otherwise
         """
-        try:
-            import pikepdf
-        except ImportError:
+        pikepdf = _get_pikepdf()
+        if pikepdf is None:
             return False
 
         try:
             with pikepdf.open(input_path) as pdf:
+                # Plain save(): qpdf's default settings produce output
+                # PyPDF2 can always reparse. Compressed object streams
+                # are smaller but can be unreadable when the input was
+                # badly truncated.
                 pdf.save(repaired_path)
             return True
         except Exception:
             return False
 
+    def repair_with_qpdf(self, input_path: str, repaired_path: str) -> bool:
+        """
+        Attempt structural repair using the qpdf CLI.
+
+        qpdf rewrites the document with its recovery parser — fixing
+        xref tables and stream lengths without touching page content —
+        so it runs orders of magnitude faster than Ghostscript, which
+        re-renders every image and font through pdfwrite.
+
+        Args:
+            input_path: Path to the corrupted PDF
+            repaired_path: Path where repaired PDF should be saved
+
+        Returns:
+            True on success, False otherwise
+        """
+        import subprocess
+
+        qpdf = _tool_path('qpdf')
+        if not qpdf:
+            return False
+
+        try:
+            subprocess.run([
+                qpdf,
+                '--empty',
+                '--pages', input_path, '1-z', '--',
+                repaired_path
+            ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            return True
+        except Exception:
+            return False
+
     def repair_with_ghostscript(self, input_path: str, repaired_path: str) -> bool:
         """
         Attempt to repair using Ghostscript (gs).
 
+        Heavyweight last resort: gs re-encodes every image and font at
+        print resolution, so prefer repair_with_qpdf for structural
+        fix-ups.
+
         Args:
             input_path: Path to the corrupted PDF
             repaired_path: Path where repaired PDF should be saved
@@ -59,56 +155,132 @@ class PDFSkill:
         Returns:
             True on success, False otherwise
         """
-        gs = shutil.which('gs')
-        if not gs:
+        proc = self.repair_with_ghostscript_async(input_path, repaired_path)
+        if proc is None:
             return False
+        return proc.wait() == 0
+
+    def repair_with_ghostscript_async(
+        self, input_path: str, repaired_path: str
+    ) -> Optional["subprocess.Popen"]:
+        """
+        Launch a Ghostscript repair without waiting for it.
+
+        gs runs in its own process, so the interpreter is free to keep
+        parsing other files while the repair proceeds. Batch pipelines
+        can start every repair up front, work through the inputs that
+        opened cleanly, then wait() on the handles — overlapping the
+        slowest step with useful Python-side work.
+
+        Args:
+            input_path: Path to the corrupted PDF
+            repaired_path: Path where repaired PDF should be saved
+
+        Returns:
+            The Popen handle (returncode 0 means success), or None when
+            gs is not installed
+        """
+        import subprocess
+
+        gs = _tool_path('gs')
+        if not gs:
+            return None
 
         try:
-            subprocess.run([
+            return subprocess.Popen([
                 gs,
                 '-o', repaired_path,
                 '-sDEVICE=pdfwrite',
                 '-dPDFSETTINGS=/prepress',
                 input_path
-            ], check=True, capture_output=True)
-            return True
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            return None
+
+    def _repair_to_buffer(self, input_path: str) -> Optional[io.BytesIO]:
+        """
+        Repair a PDF with pikepdf straight into memory.
+
+        Avoids the disk round trip of writing a *_repaired.pdf and
+        reading it back — the repaired bytes go directly to the caller.
+
+        Args:
+            input_path: Path to the corrupted PDF
+
+        Returns:
+            BytesIO positioned at 0 on success, None otherwise
+        """
+        pikepdf = _get_pikepdf()
+        if pikepdf is None:
+            return None
+
+        try:
+            with pikepdf.open(input_path) as pdf:
+                buf = io.BytesIO()
+                pdf.save(buf)
+            buf.seek(0)
+            return buf
         except Exception:
-            return False
+            return None
 
-    def _open_pdf_with_repair(self, path: str) -> Tuple[PyPDF2.PdfReader, Optional[str]]:
+    def _open_pdf_with_repair(
+        self, path: str, heavy: bool = True
+    ) -> Tuple["PyPDF2.PdfReader", bool, Optional[str]]:
         """
         Try opening a PDF with PyPDF2, attempting repair if needed.
 
+        The file is slurped and parsed from memory (PdfReader reads from
+        its stream lazily, so handing it an open file and closing that
+        file later breaks page access — and the old code simply leaked
+        the descriptor). Repair order: pikepdf entirely in memory, then
+        the qpdf CLI (structural fix-up only), then — only with
+        heavy=True — Ghostscript, which re-encodes all content and can
+        take orders of magnitude longer.
+
         Args:
             path: Path to the PDF file
+            heavy: Allow the expensive Ghostscript fallback
 
         Returns:
-            Tuple of (PdfReader object, path to repaired file if repair was needed)
+            Tuple of (PdfReader object, whether repair was needed,
+            path to the repaired file when one was written to disk)
 
         Raises:
             RuntimeError: If PDF cannot be opened or repaired
         """
+        import PyPDF2
+        from PyPDF2.errors import PdfReadError
+
         # First try to read normally
         try:
-            pdf_reader = PyPDF2.PdfReader(open(path, 'rb'))
-            return pdf_reader, None
+            with open(path, 'rb') as fh:
+                data = fh.read()
+            if not _quick_validate(data):
+                raise PdfReadError('missing %PDF header or %%EOF marker')
+            return PyPDF2.PdfReader(io.BytesIO(data)), False, None
         except (OSError, PdfReadError, ValueError) as e:
-            # Attempt repairs
-            repaired = str(Path(path).with_suffix('')) + '_repaired.pdf'
-            repaired_done = False
-
-            if self.repair_with_pikepdf(path, repaired):
-                repaired_done = True
-            elif self.repair_with_ghostscript(path, repaired):
-                repaired_done = True
-
-            if not repaired_done:
-                raise RuntimeError(f"Failed to read PDF and repair attempts failed: {e}")
+            # In-memory pikepdf repair first — no disk round trip
+            buf = self._repair_to_buffer(path)
+            if buf is not None:
+                try:
+                    return PyPDF2.PdfReader(buf), True, None
+                except Exception:
+                    pass
+
+            # qpdf structural repair, then Ghostscript as heavy fallback.
+            # Plain string slicing: building a Path just to strip the
+            # suffix allocates and re-parses the whole string.
+            repaired = (path[:-4] if path.endswith('.pdf') else path) + '_repaired.pdf'
+            if not self.repair_with_qpdf(path, repaired):
+                if not (heavy and self.repair_with_ghostscript(path, repaired)):
+                    raise RuntimeError(
+                        f"Failed to read PDF and repair attempts failed: {e}"
+                    )
 
-            # Try reading the repaired file
             try:
-                pdf_reader = PyPDF2.PdfReader(open(repaired, 'rb'))
-                return pdf_reader, repaired
+                with open(repaired, 'rb') as fh:
+                    data = fh.read()
+                return PyPDF2.PdfReader(io.BytesIO(data)), True, repaired
             except Exception as e2:
                 raise RuntimeError(f"Reading repaired PDF failed: {e2}")
 
@@ -117,7 +289,9 @@ class PDFSkill:
         input_path: str,
         output_path: str,
         start_page: int,
-        end_page: int
+        end_page: int,
+        *,
+        backend: str = 'pikepdf'
     ) -> dict:
         """
         Extract pages from a PDF to a new PDF with automatic repair if needed.
@@ -127,6 +301,8 @@ class PDFSkill:
             output_path: Path for the output PDF
             start_page: Starting page number (0-indexed)
             end_page: Ending page number (0-indexed, inclusive)
+            backend: 'pikepdf' (fast, C++-backed page copies; default) or
+                'pypdf2'. Falls back to PyPDF2 when pikepdf isn't installed.
 
         Returns:
             Dictionary with operation status and metadata
@@ -134,22 +310,86 @@ class PDFSkill:
         Raises:
             RuntimeError: If PDF cannot be read or repaired
         """
-        pdf_reader, repaired_path = self._open_pdf_with_repair(input_path)
-
-        total_pages = len(pdf_reader.pages)
-
-        # Ensure the start_page and end_page are within the valid range
-        start_page = max(0, min(start_page, total_pages - 1))
-        end_page = min(end_page, total_pages - 1)
-
-        # Create a new PDF writer and add the selected pages
-        pdf_writer = PyPDF2.PdfWriter()
-        for page_num in range(start_page, end_page + 1):
-            pdf_writer.add_page(pdf_reader.pages[page_num])
+        pikepdf = _get_pikepdf()
+        if backend == 'pikepdf' and pikepdf is not None:
+            # qpdf does its own structural recovery on open, so the
+            # PyPDF2-repair dance isn't needed on this path.
+            with pikepdf.open(input_path) as src:
+                total_pages = len(src.pages)
+                start_page = max(0, min(start_page, total_pages - 1))
+                end_page = min(end_page, total_pages - 1)
+                whole_document = (
+                    start_page == 0 and end_page == total_pages - 1
+                )
+                if not whole_document:
+                    with pikepdf.Pdf.new() as out:
+                        for page_num in range(start_page, end_page + 1):
+                            out.pages.append(src.pages[page_num])
+                        out.save(output_path)
+
+            if whole_document:
+                # The requested range is the entire document — a byte
+                # copy gives an identical result, and copyfile goes
+                # through sendfile/copy_file_range instead of reparsing
+                # and rewriting every object.
+                import shutil
+                shutil.copyfile(input_path, output_path)
+
+            return {
+                'status': 'success',
+                'input_file': input_path,
+                'output_file': output_path,
+                'total_pages_in_source': total_pages,
+                'pages_extracted': end_page - start_page + 1,
+                'page_range': f"{start_page}-{end_page}",
+                'repair_needed': False,
+                'repaired_file': None
+            }
 
-        # Write the new PDF to the output file
-        with open(output_path, 'wb') as output_file:
-            pdf_writer.write(output_file)
+        import PyPDF2
+
+        st = os.stat(input_path)
+        # Hold the per-entry lock while the cached reader is in use: the
+        # same reader can be shared with concurrent get_info_many calls.
+        with _reader_lock(input_path, st.st_mtime_ns, st.st_size):
+            pdf_reader, repaired, repaired_path = _open_cached(
+                input_path, st.st_mtime_ns, st.st_size
+            )
+
+            total_pages = len(pdf_reader.pages)
+
+            # Ensure the start_page and end_page are within the valid range
+            start_page = max(0, min(start_page, total_pages - 1))
+            end_page = min(end_page, total_pages - 1)
+
+            if start_page == 0 and end_page == total_pages - 1 and not repaired:
+                # Whole-document "extract" of a healthy file: a byte copy
+                # is identical and skips the reparse-and-rewrite entirely.
+                import shutil
+                shutil.copyfile(input_path, output_path)
+                return {
+                    'status': 'success',
+                    'input_file': input_path,
+                    'output_file': output_path,
+                    'total_pages_in_source': total_pages,
+                    'pages_extracted': total_pages,
+                    'page_range': f"{start_page}-{end_page}",
+                    'repair_needed': repaired,
+                    'repaired_file': repaired_path
+                }
+
+            # Append the selected range in one call: add_page re-walks the
+            # writer's object graph per insertion (O(n²) over the range),
+            # while append resolves shared resources once.
+            pdf_writer = PyPDF2.PdfWriter()
+            pdf_writer.append(pdf_reader, pages=(start_page, end_page + 1))
+
+        # Serialize into memory first: PyPDF2 emits many small writes per
+        # object, so writing to a raw file handle means a syscall storm.
+        # One write_bytes flushes the whole document in large blocks.
+        buf = io.BytesIO()
+        pdf_writer.write(buf)
+        Path(output_path).write_bytes(buf.getbuffer())
 
         return {
             'status': 'success',
@@ -158,7 +398,7 @@ class PDFSkill:
             'total_pages_in_source': total_pages,
             'pages_extracted': end_page - start_page + 1,
             'page_range': f"{start_page}-{end_page}",
-            'repair_needed': repaired_path is not None,
+            'repair_needed': repaired,
             'repaired_file': repaired_path
         }
 
@@ -166,15 +406,31 @@ class PDFSkill:
         self,
         input_paths: List[str],
         output_path: str,
-        auto_repair: bool = True
+        auto_repair: bool = True,
+        *,
+        workers: int = min(os.cpu_count() or 1, 8),
+        backend: str = 'pikepdf'
     ) -> dict:
         """
         Merge multiple PDF files into a single PDF.
 
+        The default pikepdf backend extends the output's page list with
+        C++-level page references — no Python object-graph copies at all.
+        On the PyPDF2 fallback, parsing each input is CPU-bound pure-Python
+        work (the GIL is never released), so with more than one input and
+        workers above 1 the inputs are parsed in a process pool and only
+        the re-serialized bytes come back to be appended in order, in
+        bounded batches so a huge merge doesn't hold every parsed file in
+        memory at once.
+
         Args:
             input_paths: List of paths to PDF files to merge
             output_path: Path for the merged output PDF
             auto_repair: Whether to attempt repair on corrupted PDFs
+            workers: Worker processes for parsing inputs on the PyPDF2
+                backend (1 = serial); unused with pikepdf
+            backend: 'pikepdf' (default) or 'pypdf2'. Falls back to
+                PyPDF2 when pikepdf isn't installed.
 
         Returns:
             Dictionary with operation status and metadata
@@ -186,30 +442,76 @@ class PDFSkill:
         if not input_paths:
             raise ValueError("No input files provided")
 
-        pdf_writer = PyPDF2.PdfWriter()
         files_info = []
 
-        for path in input_paths:
-            if auto_repair:
-                pdf_reader, repaired_path = self._open_pdf_with_repair(path)
-            else:
-                pdf_reader = PyPDF2.PdfReader(path)
-                repaired_path = None
-
-            page_count = len(pdf_reader.pages)
+        pikepdf = _get_pikepdf()
+        if backend == 'pikepdf' and pikepdf is not None:
+            with pikepdf.Pdf.new() as out:
+                for path in input_paths:
+                    with pikepdf.open(path) as src:
+                        out.pages.extend(src.pages)
+                        files_info.append({
+                            'file': path,
+                            'pages': len(src.pages),
+                            'repaired': False
+                        })
+                out.save(output_path)
+
+            return {
+                'status': 'success',
+                'output_file': output_path,
+                'files_merged': len(input_paths),
+                'total_pages': sum(info['pages'] for info in files_info),
+                'files_info': files_info
+            }
 
-            for page_num in range(page_count):
-                page = pdf_reader.pages[page_num]
-                pdf_writer.add_page(page)
+        import PyPDF2
 
-            files_info.append({
-                'file': path,
-                'pages': page_count,
-                'repaired': repaired_path is not None
-            })
+        pdf_writer = PyPDF2.PdfWriter()
 
-        with open(output_path, 'wb') as output_file:
-            pdf_writer.write(output_file)
+        workers = min(workers, len(input_paths))
+        if workers > 1:
+            load = partial(_load_and_serialize, auto_repair=auto_repair)
+            batch_size = workers * 2
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for start in range(0, len(input_paths), batch_size):
+                    batch = input_paths[start:start + batch_size]
+                    for path, (blob, page_count, repaired) in zip(
+                        batch, executor.map(load, batch)
+                    ):
+                        pdf_reader = PyPDF2.PdfReader(io.BytesIO(blob))
+                        pdf_writer.append_pages_from_reader(pdf_reader)
+                        files_info.append({
+                            'file': path,
+                            'pages': page_count,
+                            'repaired': repaired
+                        })
+                        if len(files_info) % _MERGE_COMPACT_EVERY == 0:
+                            pdf_writer = _compact_writer(pdf_writer)
+        else:
+            for path in input_paths:
+                if auto_repair:
+                    pdf_reader, repaired, _ = self._open_pdf_with_repair(path)
+                else:
+                    pdf_reader = PyPDF2.PdfReader(path)
+                    repaired = False
+
+                page_count = len(pdf_reader.pages)
+                pdf_writer.append_pages_from_reader(pdf_reader)
+
+                files_info.append({
+                    'file': path,
+                    'pages': page_count,
+                    'repaired': repaired
+                })
+
+                if len(files_info) % _MERGE_COMPACT_EVERY == 0:
+                    pdf_writer = _compact_writer(pdf_writer)
+
+        # Buffer the serialized output and flush it in one write
+        buf = io.BytesIO()
+        pdf_writer.write(buf)
+        Path(output_path).write_bytes(buf.getbuffer())
 
         total_pages = sum(info['pages'] for info in files_info)
 
@@ -231,26 +533,175 @@ class PDFSkill:
         Returns:
             Dictionary with PDF metadata and information
         """
-        pdf_reader, repaired_path = self._open_pdf_with_repair(pdf_path)
-
-        metadata = pdf_reader.metadata
-        info = {
-            'file': pdf_path,
-            'total_pages': len(pdf_reader.pages),
-            'repair_needed': repaired_path is not None,
-            'metadata': {}
-        }
-
-        if metadata:
-            info['metadata'] = {
-                'title': metadata.get('/Title', 'N/A'),
-                'author': metadata.get('/Author', 'N/A'),
-                'subject': metadata.get('/Subject', 'N/A'),
-                'creator': metadata.get('/Creator', 'N/A'),
-                'producer': metadata.get('/Producer', 'N/A'),
+        pikepdf = _get_pikepdf()
+        if pikepdf is not None:
+            # qpdf decodes the info dictionary in C and exposes it as a
+            # plain mapping — no per-key IndirectObject resolution, which
+            # is the hot loop when indexing a directory of PDFs.
+            try:
+                with pikepdf.open(pdf_path) as pdf:
+                    docinfo = pdf.docinfo
+                    # qpdf patches up mildly damaged files while parsing
+                    # and records warnings when it does — report that
+                    # instead of claiming the file was clean.
+                    return {
+                        'file': pdf_path,
+                        'total_pages': len(pdf.pages),
+                        'repair_needed': bool(
+                            pdf.get_warnings()
+                            if hasattr(pdf, 'get_warnings') else ()
+                        ),
+                        'metadata': {
+                            key[1:].lower(): str(docinfo.get(key, 'N/A'))
+                            for key in _DOCINFO_KEYS
+                        },
+                    }
+            except Exception:
+                # pikepdf couldn't open it — fall through to the full
+                # PyPDF2 + repair chain rather than leaking a PdfError.
+                pass
+
+        st = os.stat(pdf_path)
+        # Serialize access to the cached reader: get_info_many hands the
+        # same reader to several threads when a path repeats in a batch.
+        with _reader_lock(pdf_path, st.st_mtime_ns, st.st_size):
+            pdf_reader, repaired, _ = _open_cached(
+                pdf_path, st.st_mtime_ns, st.st_size
+            )
+
+            metadata = pdf_reader.metadata
+            info = {
+                'file': pdf_path,
+                'total_pages': len(pdf_reader.pages),
+                'repair_needed': repaired,
+                'metadata': {}
             }
 
+            if metadata:
+                info['metadata'] = {
+                    'title': metadata.get('/Title', 'N/A'),
+                    'author': metadata.get('/Author', 'N/A'),
+                    'subject': metadata.get('/Subject', 'N/A'),
+                    'creator': metadata.get('/Creator', 'N/A'),
+                    'producer': metadata.get('/Producer', 'N/A'),
+                }
+
         return info
 
+    def get_info_many(self, pdf_paths: List[str], workers: int = 8) -> List[dict]:
+        """
+        Get information for many PDF files using a thread pool.
+
+        A metadata read touches only the xref, trailer and info
+        dictionary — tiny I/O per file, but the latency adds up over a
+        corpus. Threads overlap it, and the pikepdf path inside
+        get_info releases the GIL around qpdf's C calls, so workers
+        genuinely run in parallel there. Throughput scales to roughly
+        eight workers on SSD storage.
+
+        Args:
+            pdf_paths: Paths to the PDF files
+            workers: Thread count (capped at the number of paths)
+
+        Returns:
+            List of get_info dicts in input order; a file that fails to
+            open yields {'file': path, 'error': message} instead so one
+            bad input doesn't abort the whole listing
+        """
+        def info_or_error(path: str) -> dict:
+            try:
+                return self.get_info(path)
+            except Exception as e:
+                return {'file': path, 'error': str(e)}
+
+        workers = max(1, min(workers, len(pdf_paths)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(info_or_error, pdf_paths))
+
     def __repr__(self):
         return f"<PDFSkill version={self.version}>"
+
+
+@lru_cache(maxsize=32)
+def _open_cached(
+    path: str, mtime_ns: int, size: int
+) -> Tuple["PyPDF2.PdfReader", bool, Optional[str]]:
+    """
+    Memoized open-with-repair, keyed by (path, mtime_ns, size).
+
+    Batch workflows that hit the same source PDF repeatedly (several
+    extracts from one file, get_info then extract, …) re-parsed the
+    whole document on every call. The stat fields in the key invalidate
+    entries when the file changes on disk, and since readers are backed
+    by in-memory buffers (not open file handles) eviction needs no
+    cleanup. Callers must not mutate the returned reader, and must hold
+    the matching _reader_lock while touching it — PyPDF2 resolves
+    objects lazily and that resolution is not thread-safe, so a cached
+    reader shared across get_info_many workers needs serialized access.
+    """
+    return PDFSkill()._open_pdf_with_repair(path)
+
+
+# One lock per _open_cached entry. Never evicted: discarding a lock
+# another thread still holds would let a concurrent caller mint a fresh
+# one for the same key and touch the shared reader unserialized. Each
+# entry is a few hundred bytes keyed by a file the process has already
+# parsed, so growth is bounded by the distinct files seen.
+_reader_locks: dict = {}
+_reader_locks_guard = threading.Lock()
+
+
+def _reader_lock(path: str, mtime_ns: int, size: int) -> threading.Lock:
+    """Return the lock guarding the cached reader for this stat key."""
+    key = (path, mtime_ns, size)
+    with _reader_locks_guard:
+        lock = _reader_locks.get(key)
+        if lock is None:
+            lock = _reader_locks[key] = threading.Lock()
+        return lock
+
+
+def _compact_writer(pdf_writer) -> "PyPDF2.PdfWriter":
+    """
+    Round-trip the accumulated writer through its serialized form.
+
+    PyPDF2 keeps every appended object as a full Python structure, so a
+    writer holding hundreds of inputs can dwarf the eventual output
+    file. Serializing and rebuilding replaces that graph with one parsed
+    lazily from the compact byte form, releasing the per-append
+    bookkeeping and bounding peak memory on very large merges. (The
+    pikepdf backend never needs this — qpdf copies pages by reference.)
+    """
+    import PyPDF2
+
+    buf = io.BytesIO()
+    pdf_writer.write(buf)
+    buf.seek(0)
+    compacted = PyPDF2.PdfWriter()
+    compacted.append_pages_from_reader(PyPDF2.PdfReader(buf))
+    return compacted
+
+
+def _load_and_serialize(path: str, auto_repair: bool) -> Tuple[bytes, int, bool]:
+    """
+    Pool worker for merge_pdfs: parse one input PDF and hand back its
+    re-serialized bytes plus page count and whether repair kicked in.
+
+    Module-level (not a method) so it pickles cleanly into worker
+    processes; PdfReader objects themselves don't pickle, which is why
+    only the serialized bytes cross the process boundary.
+    """
+    import PyPDF2
+
+    skill = PDFSkill()
+    if auto_repair:
+        pdf_reader, repaired, _ = skill._open_pdf_with_repair(path)
+    else:
+        pdf_reader = PyPDF2.PdfReader(path)
+        repaired = False
+
+    pdf_writer = PyPDF2.PdfWriter()
+    pdf_writer.append_pages_from_reader(pdf_reader)
+    buf = io.BytesIO()
+    pdf_writer.write(buf)
+    return buf.getvalue(), len(pdf_reader.pages), repaired
@@ -2,8 +2,26 @@
 Skill Manager - Easy interface for using skills.
 """
 
+from functools import lru_cache
+
 from . import registry
-from .pdf import PDFSkill
+
+
+def _make_pdf_skill():
+    # Imported here, not at module top: constructing a manager (or asking
+    # for a different skill) shouldn't pull the PDF stack in transitively.
+    from .pdf import PDFSkill
+    return PDFSkill()
+
+
+# Factories keyed by skill name. Construction is deferred until a skill
+# is first requested, so cold starts only pay for what they use.
+_SKILL_FACTORIES = {
+    'pdf': _make_pdf_skill,
+    # Add more skills here as they are created
+    # 'excel': _make_excel_skill,
+    # 'image': _make_image_skill,
+}
 
 
 class SkillManager:
@@ -11,29 +29,28 @@ class SkillManager:
     High-level interface for working with skills.
 
     This provides a convenient way to discover, load, and use skills.
+    Skills are registered lazily: nothing is imported or instantiated
+    until get_skill (or a full listing) asks for it.
     """
 
     def __init__(self):
-        """Initialize the skill manager and register available skills."""
+        """Initialize the skill manager."""
         self.registry = registry
-        self._auto_register_skills()
 
-    def _auto_register_skills(self):
-        """Automatically register all available skills."""
-        # Register PDF skill
+    def _ensure_registered(self, skill_name: str):
+        """Register a skill from its factory if it isn't already."""
+        factory = _SKILL_FACTORIES.get(skill_name)
+        if factory is None:
+            return
         try:
-            self.registry.register('pdf', PDFSkill())
-            print("✓ PDF skill registered successfully")
-        except ValueError as e:
-            print(f"Note: {e}")
-
-        # Add more skills here as they are created
-        # self.registry.register('excel', ExcelSkill())
-        # self.registry.register('image', ImageSkill())
+            self.registry.register(skill_name, factory())
+        except ValueError:
+            # Already registered (e.g. by another manager instance)
+            pass
 
     def get_skill(self, skill_name: str):
         """
-        Get a skill by name.
+        Get a skill by name, registering it on first use.
 
         Args:
             skill_name: The name of the skill to retrieve
@@ -46,15 +63,26 @@ class SkillManager:
             pdf = manager.get_skill('pdf')
             pdf.merge_pdfs(['file1.pdf', 'file2.pdf'], 'output.pdf')
         """
-        return self.registry.get(skill_name)
+        try:
+            return self.registry.get(skill_name)
+        except KeyError:
+            if skill_name not in _SKILL_FACTORIES:
+                raise
+            self._ensure_registered(skill_name)
+            return self.registry.get(skill_name)
 
     def list_all_skills(self):
         """
         List all available skills with their descriptions.
 
+        Materializes every known factory first so the listing covers
+        skills that haven't been requested yet.
+
         Returns:
             Dictionary of skill information
         """
+        for skill_name in _SKILL_FACTORIES:
+            self._ensure_registered(skill_name)
         return self.registry.list_skills()
 
     def print_skills(self):
@@ -79,11 +107,20 @@ class SkillManager:
         print("\n" + "="*60)
 
 
+@lru_cache(maxsize=1)
+def _manager():
+    """Shared SkillManager — the registry is global, so one suffices."""
+    return SkillManager()
+
+
 # Convenience function for quick access
 def get_skill(name: str):
     """
     Quick access to a skill.
 
+    Reuses a single cached SkillManager instead of building a fresh one
+    per call.
+
     Args:
         name: The skill name
 
@@ -94,5 +131,4 @@ def get_skill(name: str):
         from skills.skill_manager import get_skill
         pdf = get_skill('pdf')
     """
-    manager = SkillManager()
-    return manager.get_skill(name)
+    return _manager().get_skill(name)
@@ -1,8 +1,25 @@
+import functools
+import hashlib
+import io
+import mmap
+import os
+import pathlib
+import re
+import tempfile
+
 import PyPDF2
 import subprocess
 import shutil
 from PyPDF2.errors import PdfReadError
 
+try:
+    # PyMuPDF. MuPDF's C core parses the xref and copies page objects
+    # without wrapping every indirect reference in a Python object, so
+    # merge/extract run roughly 10x faster than PyPDF2 on the same files.
+    import fitz
+except ImportError:
+    fitz = None
+
 
 def repair_with_pikepdf(input_path, repaired_path):
     """Try to repair a PDF using pikepdf (requires qpdf installed).
@@ -22,67 +39,313 @@ def repair_with_pikepdf(input_path, repaired_path):
         return False
 
 
-def repair_with_ghostscript(input_path, repaired_path):
-    """Attempt to repair using Ghostscript (gs). Returns True on success."""
+def _start_ghostscript(input_path, repaired_path):
+    """Launch a Ghostscript repair without waiting. Popen or None."""
     gs = shutil.which('gs')
     if not gs:
-        return False
+        return None
 
     try:
-        subprocess.run([
+        # /default instead of /prepress: repair only needs a structural
+        # rewrite, and /prepress forces a high-resolution re-encode of
+        # every image — easily 10x slower on image-heavy files.
+        return subprocess.Popen([
             gs,
             '-o', repaired_path,
             '-sDEVICE=pdfwrite',
-            '-dPDFSETTINGS=/prepress',
+            '-dPDFSETTINGS=/default',
+            '-dNOPAUSE', '-dBATCH', '-dQUIET',
+            f'-dNumRenderingThreads={os.cpu_count() or 1}',
             input_path
-        ], check=True)
-        return True
-    except Exception:
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError:
+        return None
+
+
+def repair_with_ghostscript(input_path, repaired_path):
+    """Attempt to repair using Ghostscript (gs). Returns True on success."""
+    proc = _start_ghostscript(input_path, repaired_path)
+    return proc is not None and proc.wait() == 0
+
+
+def _repair_racing(input_path, repaired_path):
+    """Run the pikepdf and Ghostscript repairs concurrently.
+
+    For badly broken files both candidates can take seconds; racing
+    them and taking the first success roughly halves worst-case
+    latency. Each writes to its own temp name so they can't clobber
+    each other; the winner is renamed into place and a still-running
+    gs is terminated once pikepdf has won.
+    """
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    pike_out = repaired_path + '.pikepdf'
+    gs_out = repaired_path + '.gs'
+    gs_proc = _start_ghostscript(input_path, gs_out)
+
+    winner = None
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        candidates = {ex.submit(repair_with_pikepdf, input_path, pike_out): pike_out}
+        if gs_proc is not None:
+            candidates[ex.submit(lambda: gs_proc.wait() == 0)] = gs_out
+
+        pending = set(candidates)
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.result():
+                    winner = candidates[future]
+                    break
+
+        # Don't let the executor shutdown block on a gs that lost
+        if gs_proc is not None and winner != gs_out:
+            gs_proc.terminate()
+
+    if winner is not None:
+        os.replace(winner, repaired_path)
+    for leftover in (pike_out, gs_out):
+        if leftover != winner and os.path.exists(leftover):
+            os.remove(leftover)
+    return winner is not None
+
+
+# Repaired PDFs are cached here keyed by content, so re-running a batch
+# doesn't pay the multi-second Ghostscript invocation twice for the same
+# broken file.
+_REPAIR_CACHE_DIR = pathlib.Path(tempfile.gettempdir()) / 'pdf_repair_cache'
+
+
+def _repair_cache_key(input_path):
+    """Content key for the repair cache.
+
+    Hashing the first and last 1MB plus the file size identifies the
+    input without reading very large files end to end. The tail matters:
+    two copies of the same document damaged at different points past the
+    first megabyte share a head and size, and keying on the head alone
+    would serve one file the other's cached repair output.
+    """
+    size = os.path.getsize(input_path)
+    h = hashlib.blake2b(digest_size=16)
+    with open(input_path, 'rb') as f:
+        h.update(f.read(1 << 20))
+        if size > 2 << 20:
+            f.seek(size - (1 << 20))
+        h.update(f.read(1 << 20))
+    h.update(str(size).encode())
+    return h.hexdigest()
+
+
+def _is_heavy_objstm(path):
+    """Detect object-stream-heavy PDFs from a raw scan of the file tail.
+
+    PyPDF2 re-walks an object stream per lookup, which degrades to
+    O(N^2) when one huge /ObjStm holds most of the document (typical of
+    generated invoices). Grepping the last 64KB for /ObjStm entries
+    with a large /N spots these without parsing anything.
+    """
+    try:
+        with open(path, 'rb') as f:
+            f.seek(max(0, os.path.getsize(path) - (64 << 10)))
+            tail = f.read()
+    except OSError:
+        return False
+    if b'/ObjStm' not in tail:
         return False
+    return any(int(n) > 500 for n in re.findall(rb'/N\s+(\d+)', tail))
+
+
+# Files at or above this size are parsed from an mmap instead of a
+# slurped private copy
+_MMAP_THRESHOLD = 8 << 20
 
 
 def _open_pdf_reader(path):
-    """Try opening a PDF with PyPDF2. Return PdfReader or raise."""
+    """Try opening a PDF with PyPDF2. Return PdfReader or raise.
+
+    Small files are slurped into memory: PyPDF2 seeks constantly while
+    resolving objects, and on a network filesystem each seek is a round
+    trip. Large files are memory-mapped instead — mmap speaks the same
+    read/seek protocol, the kernel page cache is shared rather than
+    copied into a private buffer, and each read costs no userland
+    memcpy. The reader holds the only reference to the mapping, so it
+    stays valid for the reader's lifetime.
+    """
+    if _is_heavy_objstm(path):
+        # Expand the object streams through qpdf's C parser first, so
+        # PyPDF2 never hits its quadratic ObjStm lookup path. (When
+        # PyMuPDF is installed these files take the fitz branch and
+        # never reach here.)
+        try:
+            import pikepdf
+            buf = io.BytesIO()
+            with pikepdf.open(path) as pdf:
+                pdf.save(buf, object_stream_mode=pikepdf.ObjectStreamMode.disable)
+            buf.seek(0)
+            return PyPDF2.PdfReader(buf)
+        except Exception:
+            pass
+
+    if os.path.getsize(path) >= _MMAP_THRESHOLD:
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return PyPDF2.PdfReader(mm)
+
     with open(path, 'rb') as f:
-        return PyPDF2.PdfReader(f)
+        return PyPDF2.PdfReader(io.BytesIO(f.read()))
+
+
+@functools.lru_cache(maxsize=32)
+def _get_reader(path, mtime):
+    """Cached PdfReader keyed by (path, mtime).
+
+    A workflow that merges a bundle and then extracts from the same files
+    re-parsed the whole xref table on every call. The mtime in the key
+    drops stale entries when a file changes on disk. Parsing happens
+    from an in-memory copy (see _open_pdf_reader), which also means
+    cached readers hold no open file descriptors.
+    """
+    return _open_pdf_reader(path)
+
+
+def _prefetch_iter(paths, window=4):
+    """Read inputs ahead of the consumer; yield BytesIO buffers in order.
+
+    Threads overlap the reads (each worker sits in a single read() with
+    the GIL released) so parsing never waits on the disk. A small
+    look-ahead window — rather than slurping the whole batch up front —
+    lets the first parse start as soon as the first file lands and
+    bounds buffered bytes to roughly `window` files.
+    """
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+    from itertools import islice
+
+    def read(path):
+        with open(path, 'rb') as f:
+            return io.BytesIO(f.read())
+
+    with ThreadPoolExecutor(max_workers=window) as ex:
+        remaining = iter(paths)
+        pending = deque(ex.submit(read, p) for p in islice(remaining, window))
+        while pending:
+            buf = pending.popleft().result()
+            for path in islice(remaining, 1):
+                pending.append(ex.submit(read, path))
+            yield buf
+
+
+def _copy_bytes(src, dst):
+    """Copy a file in kernel space with os.sendfile when available.
+
+    No userland buffer, no PyPDF2 parse — the pages never leave the
+    kernel page cache. Falls back to copyfileobj where sendfile isn't
+    supported for regular files.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        try:
+            size = os.fstat(fsrc.fileno()).st_size
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except (AttributeError, OSError):
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst, 1 << 20)
 
 
 def extract_pages(input_path, output_path, start_page, end_page):
     """Extract pages from a PDF to a new PDF with simple repair-and-retry logic.
 
-    If reading fails, attempt repair with pikepdf, then Ghostscript, and retry.
+    Prefers PyMuPDF, which copies the page range in C. Without it, falls
+    back to PyPDF2; if reading fails there, attempt repair with pikepdf,
+    then Ghostscript, and retry.
     """
-    # First try to read normally (allow PyPDF2 to be strict=False by reopening with file)
+    if fitz is not None:
+        src = fitz.open(input_path)
+        page_count = src.page_count
+        start_page = max(0, min(start_page, page_count - 1))
+        end_page = min(end_page, page_count - 1)
+        out = fitz.open()
+        out.insert_pdf(src, from_page=start_page, to_page=end_page)
+        out.save(output_path, garbage=4, deflate=True, clean=True)
+        out.close()
+        src.close()
+        return
+
+    # First try to read normally. Both this attempt and the repaired-file
+    # retry go through _open_pdf_reader, which scopes the descriptor to a
+    # with-block — no handle is left dangling when extraction loops over
+    # many files.
+    # Tracks the on-disk file the reader faithfully reflects, so a
+    # full-range extract can be served as a raw byte copy. Cleared when
+    # only the lenient strict=False parse succeeded (the bytes on disk
+    # are dirty and worth rewriting).
+    source_path = input_path
+
     try:
-        pdf_reader = PyPDF2.PdfReader(open(input_path, 'rb'))
+        pdf_reader = _get_reader(input_path, os.path.getmtime(input_path))
     except (OSError, PdfReadError, ValueError) as e:
-        # Attempt repairs
-        repaired = input_path.rstrip('.pdf') + '_repaired.pdf'
-        repaired_done = False
+        # Many read errors are soft — trailing garbage, slightly-off
+        # xref offsets — and a strict=False parse shrugs them off.
+        # Retry that before paying for a multi-second subprocess repair.
+        try:
+            with open(input_path, 'rb') as f:
+                pdf_reader = PyPDF2.PdfReader(io.BytesIO(f.read()), strict=False)
+            source_path = None
+        except Exception:
+            # Attempt repairs. Note with_suffix, not rstrip:
+            # rstrip('.pdf') strips any trailing run of those
+            # characters, so a name like 'foo_pdf.pdf' lost real
+            # characters and the repaired file was never found again on
+            # the next run.
+            repaired = str(pathlib.Path(input_path).with_suffix('')) + '_repaired.pdf'
+            repaired_done = False
 
-        if repair_with_pikepdf(input_path, repaired):
-            repaired_done = True
-        else:
-            if repair_with_ghostscript(input_path, repaired):
+            # A previous run may have repaired this exact content already
+            cached = _REPAIR_CACHE_DIR / (_repair_cache_key(input_path) + '.pdf')
+            if cached.exists():
+                shutil.copyfile(cached, repaired)
                 repaired_done = True
+            else:
+                repaired_done = _repair_racing(input_path, repaired)
 
-        if not repaired_done:
-            raise RuntimeError(f"Failed to read PDF and repair attempts failed: {e}")
+                if repaired_done:
+                    _REPAIR_CACHE_DIR.mkdir(exist_ok=True)
+                    shutil.copyfile(repaired, cached)
 
-        # Try reading the repaired file
-        try:
-            pdf_reader = PyPDF2.PdfReader(open(repaired, 'rb'))
-        except Exception as e2:
-            raise RuntimeError(f"Reading repaired PDF failed: {e2}")
+            if not repaired_done:
+                raise RuntimeError(f"Failed to read PDF and repair attempts failed: {e}")
+
+            # Try reading the repaired file
+            try:
+                pdf_reader = _open_pdf_reader(repaired)
+                source_path = repaired
+            except Exception as e2:
+                raise RuntimeError(f"Reading repaired PDF failed: {e2}")
 
-    # Ensure the start_page and end_page are within the valid range
-    start_page = max(0, min(start_page, len(pdf_reader.pages) - 1))
-    end_page = min(end_page, len(pdf_reader.pages) - 1)
+    # Ensure the start_page and end_page are within the valid range.
+    # pages is a lazy _VirtualList — every len() walks the page tree, so
+    # resolve the count once.
+    total_pages = len(pdf_reader.pages)
+    start_page = max(0, min(start_page, total_pages - 1))
+    end_page = min(end_page, total_pages - 1)
 
-    # Create a new PDF writer and add the selected pages
+    if source_path and start_page == 0 and end_page == total_pages - 1:
+        # Full-range extract: the output is byte-identical to the source
+        # (repaired file when repair ran), so skip the writer pipeline
+        # and let the kernel copy it.
+        _copy_bytes(source_path, output_path)
+        return
+
+    # Copy the whole range in one append call: add_page resolves every
+    # indirect reference per page through Python, while append clones the
+    # range against a shared object cache in a single pass.
     pdf_writer = PyPDF2.PdfWriter()
-    for page_num in range(start_page, end_page + 1):
-        pdf_writer.add_page(pdf_reader.pages[page_num])
+    pdf_writer.append(pdf_reader, pages=(start_page, end_page + 1))
 
     # Write the new PDF to the output file
     with open(output_path, 'wb') as output_file:
@@ -90,38 +353,102 @@ def extract_pages(input_path, output_path, start_page, end_page):
 
 
 def merge_pdfs(input_paths, output_path):
+    if not input_paths:
+        raise ValueError("No input files provided")
+
+    if fitz is not None:
+        # Open every input concurrently — MuPDF releases the GIL while
+        # its C core parses, so the opens genuinely overlap — then do
+        # the order-sensitive insert_pdf passes serially.
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(input_paths))) as ex:
+            readers = list(ex.map(fitz.open, input_paths))
+
+        out = fitz.open()
+        for src in readers:
+            out.insert_pdf(src)
+            src.close()
+        out.save(output_path, garbage=4, deflate=True, clean=True)
+        out.close()
+        return
+
     pdf_writer = PyPDF2.PdfWriter()
 
-    for path in input_paths:
-        pdf_reader = PyPDF2.PdfReader(path)
-        for page_num in range(len(pdf_reader.pages)):
-            page = pdf_reader.pages[page_num]
-            pdf_writer.add_page(page)
+    # Pipeline the parse and append stages: a producer thread parses the
+    # next input while the main thread is still appending the previous
+    # one (PyPDF2 releases the GIL around zlib and I/O, so the stages
+    # overlap). The bounded queue caps how many parsed readers are alive
+    # at once, keeping memory flat on big bundles.
+    import queue
+    import threading
+
+    parsed = queue.Queue(maxsize=2)
+    cancelled = threading.Event()
+
+    def put_unless_cancelled(item):
+        # Bounded put so the producer can't block forever on a consumer
+        # that died mid-merge (e.g. append_pages_from_reader raising)
+        while not cancelled.is_set():
+            try:
+                parsed.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for buf in _prefetch_iter(input_paths):
+                if not put_unless_cancelled(PyPDF2.PdfReader(buf)):
+                    return
+        except Exception as e:
+            put_unless_cancelled(e)
+        else:
+            put_unless_cancelled(None)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            item = parsed.get()
+            if item is None:
+                break
+            if isinstance(item, Exception):
+                raise item
+            # Bulk append shares the reader's object cache across pages
+            # instead of re-resolving indirect references per add_page call
+            pdf_writer.append_pages_from_reader(item)
+    finally:
+        cancelled.set()
+        # Drop anything still buffered so a producer mid-put wakes up
+        while True:
+            try:
+                parsed.get_nowait()
+            except queue.Empty:
+                break
+        producer.join()
 
     with open(output_path, 'wb') as output_file:
         pdf_writer.write(output_file)
 
 
-# Example usage
-# input_files = ['Document_2024-02-13_224105.pdf', 'Srinika_Artwork_file.pdf']  # List of PDF files to merge
-# output_file = 'Srinika_Artwork_final.pdf'  # Output file name
-
-# merge_pdfs(input_files, output_file)
-
-base_location = '/Users/username/Documents/Contracts'
-input_file = 'Contract_Bundle_2025.pdf'
-output_file = 'Signed_Agreement.pdf'
-# Example usage
-input_file_path = base_location+'/'+ input_file
-output_file_path = base_location+'/'+ output_file
-start_page_number = 6
-end_page_number = 7
-
-file_1 = 'IMG_0002.pdf'
-file_2 = 'IMG_0003.pdf'
-input_file_path_1 = base_location+'/'+ file_1
-input_file_path_2 = base_location+'/'+ file_2
-extract_pages(input_file_path, output_file_path, start_page_number, end_page_number)
-# input_paths = [input_file_path_1, input_file_path_2]  # List of PDF files to merge
-# merge_pdfs(input_paths, output_file_path)
+# Example usage — guarded so importing this module (e.g. through the
+# skills registry) never runs a PDF parse against hardcoded paths.
+if __name__ == '__main__':
+    base_location = '/Users/username/Documents/Contracts'
+    input_file = 'Contract_Bundle_2025.pdf'
+    output_file = 'Signed_Agreement.pdf'
+    input_file_path = base_location + '/' + input_file
+    output_file_path = base_location + '/' + output_file
+    start_page_number = 6
+    end_page_number = 7
+
+    extract_pages(input_file_path, output_file_path, start_page_number, end_page_number)
+
+    # file_1 = 'IMG_0002.pdf'
+    # file_2 = 'IMG_0003.pdf'
+    # input_paths = [base_location + '/' + file_1, base_location + '/' + file_2]
+    # merge_pdfs(input_paths, output_file_path)
 